@@ -1,18 +1,22 @@
 from .config import PipelineConfig, ProcessorConfig, RayConfig, get_default_ray_config
-from .ops import FilterFn, MapFn, ReduceFn, Row
+from .ops import Batch, FilterFn, MapBatchesFn, MapFn, ReduceFn, Row
 from .pipeline import DataPipeline
 from .registry import components
-from .utils import get_field, set_field
+from .utils import compile_getter, get_field, get_many, set_field
 
 __all__ = [
     "DataPipeline",
     "PipelineConfig",
     "RayConfig",
     "MapFn",
+    "MapBatchesFn",
     "FilterFn",
     "ReduceFn",
     "components",
     "Row",
+    "Batch",
+    "compile_getter",
     "get_field",
+    "get_many",
     "set_field",
 ]
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
 
 
 Row: TypeAlias = dict[str, Any]
+Batch: TypeAlias = dict[str, Any]
 
 
 class ReduceFn(ABC, BaseModel):
@@ -35,6 +36,23 @@ class MapFn(ABC, BaseModel):
         raise NotImplementedError
 
 
+class MapBatchesFn(ABC, BaseModel):
+    """Abstract base class for batched map operations.
+
+    Unlike MapFn, implementations receive a whole batch of column arrays at
+    once (Ray Data "numpy" batch format), amortizing per-row dispatch overhead.
+    """
+
+    name: str = Field(title="The name of this batched map function.")
+    on: str = Field(title="The column to read input data from for the map operation.")
+    to: str = Field(title="The column to write the results of the map operation to.")
+
+    @abstractmethod
+    def __call__(self, batch: Batch) -> Batch:
+        """Read a batch and return the batch with the map operation applied to it."""
+        raise NotImplementedError
+
+
 class FilterFn(ABC, BaseModel):
     """Abstract base class for filter operations."""
 
@@ -7,7 +7,7 @@ if TYPE_CHECKING:
 from ray.data import DataContext, Dataset
 
 from .filesystem import get_fs
-from .ops import FilterFn, MapFn, ReduceFn
+from .ops import FilterFn, MapBatchesFn, MapFn, ReduceFn
 from .readers import Reader
 from .registry import components
 from .utils import get_field
@@ -58,11 +58,14 @@ class DataPipeline:
             processor = components.get(processor_config.category, processor_config.type)(**processor_config.params)
             if isinstance(processor, FilterFn):
                 self.dataset = self.dataset.filter(processor, **self.config.ray_config.get_filter_kwargs())
+            elif isinstance(processor, MapBatchesFn):
+                self.dataset = self.dataset.map_batches(processor, **self.config.ray_config.get_batch_kwargs())
             elif isinstance(processor, MapFn):
                 self.dataset = self.dataset.map(processor, **self.config.ray_config.get_map_kwargs())
             else:
                 raise ValueError(
-                    f"Processors must either inherit from 'MapFn'  or 'FilterFn'; got {type(processor).__bases__}"
+                    f"Processors must either inherit from 'MapFn', 'MapBatchesFn' or 'FilterFn'; "
+                    f"got {type(processor).__bases__}"
                 )
 
     def write(self, **kwargs: Any) -> None:
@@ -12,6 +12,9 @@ class Registry:
         # Format: {category: {type: class}}
         self._classes: dict[str, dict[str, type]] = {}
         self._schemas: dict[str, dict[str, dict[str, Any]]] = {}
+        # Flat (category, type) -> class cache so hot factory paths resolve
+        # components with a single dict probe
+        self._resolved: dict[tuple[str, str], type] = {}
 
     def add(self, category: str, identifier: str) -> Callable[[type], type[BaseModel] | type]:
         """Register a component class for a specific format."""
@@ -21,6 +24,8 @@ class Registry:
                 self._classes[category] = {identifier: cls}
             else:
                 self._classes[category][identifier] = cls
+            # Re-registration must not serve a stale class from the cache
+            self._resolved.pop((category, identifier), None)
 
             # Generate and cache schema if it's a Pydantic model
             if issubclass(cls, BaseModel):
@@ -45,14 +50,21 @@ class Registry:
 
     def get(self, category: str, identifier: str) -> type:
         """Get component class for specific category and type."""
+        key = (category, identifier)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
         try:
             cats = self._classes[category]
         except KeyError:
             raise ValueError(f"Unknown category '{category}'. Available formats: {list(self._classes.keys())}")
         try:
-            return cats[identifier]
+            cls = cats[identifier]
         except KeyError:
             raise ValueError(f"Unknown type '{identifier}' in category '{category}'")
+        self._resolved[key] = cls
+        return cls
 
     def get_schema(self, category: str, identifier: str) -> dict[str, Any]:
         """Get JSON schema for a specific component."""
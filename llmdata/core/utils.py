@@ -1,13 +1,39 @@
+import functools
+import hashlib
 import logging
+import os
+import sys
+import tempfile
 from contextlib import contextmanager
-from typing import Any, Generator
+from pathlib import Path
+from typing import Any, Callable, Generator, Sequence
+from urllib.parse import urlparse
+
+import urllib3
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_path(field: str) -> tuple[str, ...]:
+    """Split a dotted field path once and reuse the tuple.
+
+    Pipelines resolve the same handful of paths for every row, so the split
+    collapses to a cache probe after the first call; the bound keeps the
+    cache small even if callers generate field names dynamically. Segments
+    are interned so the dict probes in get_field/set_field hit CPython's
+    pointer-identity fast path for unicode keys.
+    """
+    return tuple(sys.intern(s) for s in field.split("."))
+
+
+_MISSING = object()
 
 
 def set_field(row: dict[str, Any], field: str, value: Any) -> None:
     """Set a value in a nested dictionary using dot notation.
 
     Creates intermediate dictionaries as needed. If any intermediate
-    value exists and is not a dict, raises TypeError.
+    value exists and is not a dict, raises TypeError. Fields without dots
+    are stored with a single assignment.
 
     Args:
         row: The dictionary to modify
@@ -27,29 +53,37 @@ def set_field(row: dict[str, Any], field: str, value: Any) -> None:
     if not field:
         raise ValueError("Field cannot be empty")
 
-    keys = field.split(".")
+    # Dotless fields need no traversal at all
+    if "." not in field:
+        row[field] = value
+        return
+
+    *parents, last = _split_path(field)
     current = row
 
-    # Navigate to the parent of the target key
-    for key in keys[:-1]:
-        if key not in current:
-            current[key] = {}
-        elif not isinstance(current[key], dict):
+    # Navigate to the parent of the target key; one get per hop, with the
+    # terminal assignment peeled out of the loop
+    for key in parents:
+        nxt = current.get(key, _MISSING)
+        if nxt is _MISSING:
+            nxt = current[key] = {}
+        elif type(nxt) is not dict and not isinstance(nxt, dict):
             raise TypeError(
                 f"Cannot set field '{field}': intermediate key '{key}' "
-                f"exists but is not a dict (type: {type(current[key]).__name__})"
+                f"exists but is not a dict (type: {type(nxt).__name__})"
             )
-        current = current[key]
+        current = nxt
 
     # Set the final value
-    current[keys[-1]] = value
+    current[last] = value
 
 
 def get_field(row: dict[str, Any], field: str) -> Any | None:
     """Get a value from a nested dictionary using dot notation.
 
     Returns None if any part of the path doesn't exist or if an
-    intermediate value is not a dictionary.
+    intermediate value is not a dictionary. Fields without dots are
+    answered with a single lookup.
 
     Args:
         row: The dictionary to read from
@@ -68,17 +102,190 @@ def get_field(row: dict[str, Any], field: str) -> Any | None:
     if not field:
         return None
 
-    keys = field.split(".")
-    current = row
+    # Dotless fields are the overwhelmingly common case for flat rows; a
+    # single dict lookup covers them without splitting at all.
+    if "." not in field:
+        return row.get(field)
 
-    for key in keys:
-        if not isinstance(current, dict) or key not in current:
+    current: Any = row
+    for key in _split_path(field):
+        # Identity check first: rows are plain dicts in practice, and
+        # type(x) is dict is a pointer comparison vs isinstance's dispatch
+        if type(current) is not dict and not isinstance(current, dict):
+            return None
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
             return None
-        current = current[key]
 
     return current
 
 
+def get_many(row: dict[str, Any], fields: Sequence[str]) -> dict[str, Any]:
+    """Get several dotted fields from a row, walking shared prefixes once.
+
+    Paths that share a prefix (e.g. "metadata.language.score" and
+    "metadata.language.confidence") resolve the common hops a single time
+    instead of once per field. Semantics per field match get_field.
+
+    Args:
+        row: The dictionary to read from
+        fields: Dot-separated paths to resolve
+
+    Returns:
+        Mapping of each requested field to its value (None if not found)
+
+    Example:
+        >>> data = {"metadata": {"language": {"score": 0.95, "name": "en"}}}
+        >>> get_many(data, ["metadata.language.score", "metadata.language.name"])
+        {'metadata.language.score': 0.95, 'metadata.language.name': 'en'}
+    """
+    result: dict[str, Any] = {}
+    nested: list[tuple[tuple[str, ...], str]] = []
+    for field in fields:
+        if not field:
+            result[field] = None
+        elif "." not in field:
+            result[field] = row.get(field)
+        else:
+            nested.append((_split_path(field), field))
+
+    if nested:
+        _get_many_walk(row, nested, 0, result)
+    return result
+
+
+def _get_many_walk(
+    current: dict[str, Any],
+    items: list[tuple[tuple[str, ...], str]],
+    depth: int,
+    out: dict[str, Any],
+) -> None:
+    """Resolve one trie level of dotted paths against the current dict."""
+    groups: dict[str, list[tuple[tuple[str, ...], str]]] = {}
+    for item in items:
+        groups.setdefault(item[0][depth], []).append(item)
+
+    for key, group in groups.items():
+        value = current.get(key, _MISSING)
+        deeper = []
+        for keys, field in group:
+            if len(keys) == depth + 1:
+                out[field] = None if value is _MISSING else value
+            else:
+                deeper.append((keys, field))
+        if deeper:
+            if type(value) is dict or isinstance(value, dict):
+                _get_many_walk(value, deeper, depth + 1, out)
+            else:
+                for _, field in deeper:
+                    out[field] = None
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_getter(field: str) -> Callable[[dict[str, Any]], Any]:
+    """Compile a dotted field path into a specialized accessor function.
+
+    For paths fixed at pipeline build time, the returned function replaces
+    get_field's per-call split and traversal loop with a direct chain of
+    subscript operations — the bytecode a hand-written accessor would have.
+    Missing or non-dict intermediates yield None, matching get_field.
+
+    Args:
+        field: Dot-separated path (e.g., "metadata.language.score")
+
+    Returns:
+        A function mapping a row dict to the value at the path, or None
+
+    Example:
+        >>> score_of = compile_getter("metadata.language.score")
+        >>> score_of({"metadata": {"language": {"score": 0.95}}})
+        0.95
+    """
+    if not field:
+        return lambda row: None
+
+    chain = "".join(f"[{key!r}]" for key in _split_path(field))
+    source = (
+        "def _getter(row):\n"
+        "    try:\n"
+        f"        return row{chain}\n"
+        "    except (KeyError, TypeError):\n"
+        "        return None\n"
+    )
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)  # noqa: S102 - source is built from the literal path only
+    getter: Callable[[dict[str, Any]], Any] = namespace["_getter"]
+    return getter
+
+
+def get_cache_dir() -> Path:
+    """Return the llmdata artifact cache directory, creating it if needed.
+
+    Honors XDG_CACHE_HOME and falls back to ~/.cache.
+    """
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "llmdata"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+@functools.cache
+def _get_pool_manager() -> urllib3.PoolManager:
+    """Return the shared connection pool for artifact downloads.
+
+    A single PoolManager reuses TCP/TLS connections across the multiple
+    artifacts fetched from one host (e.g. the three KenLM files), instead of
+    paying a fresh handshake per download.
+    """
+    return urllib3.PoolManager(maxsize=4, retries=urllib3.Retry(total=3, backoff_factor=0.5))
+
+
+def download_to_cache(url: str) -> str:
+    """Download a remote artifact into the llmdata cache and return its path.
+
+    Files are keyed by a hash of the URL plus the original filename, so
+    repeated calls (e.g. from restarted pipeline workers) reuse the existing
+    download instead of re-fetching the artifact.
+
+    Args:
+        url: The URL to download from
+
+    Returns:
+        Local filesystem path of the cached artifact
+
+    Raises:
+        OSError: If the server does not return a successful response
+    """
+    filename = f"{hashlib.sha256(url.encode()).hexdigest()[:16]}-{os.path.basename(urlparse(url).path)}"
+    path = get_cache_dir() / filename
+    if path.is_file() and path.stat().st_size > 0:
+        return str(path)
+
+    # Download to a unique temp name first so a partial download is never
+    # picked up and concurrent downloaders (e.g. several restarted workers on
+    # one cold-cache node) never truncate each other's stream; each finished
+    # copy is atomically renamed over the target, so the last writer wins
+    # with identical content.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            response = _get_pool_manager().request("GET", url, preload_content=False)
+            try:
+                if response.status != 200:
+                    raise OSError(f"Download of {url} failed with status {response.status}")
+                for chunk in response.stream(1 << 20):
+                    f.write(chunk)
+            finally:
+                response.release_conn()
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return str(path)
+
+
 @contextmanager
 def silence(highest_level: Any = logging.CRITICAL) -> Generator[None, Any, None]:
     """Silence all warnings and logging in the current context."""
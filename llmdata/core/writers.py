@@ -20,6 +20,13 @@ class Writer:
     ) -> None:
         self.config = config or get_default_ray_config()
         self.params = kwargs
+        # Config and params are fixed at construction, so the merged write
+        # kwargs are built once here instead of on every write call
+        self._write_kwargs = self._build_write_kwargs()
+
+    def _build_write_kwargs(self) -> dict[str, Any]:
+        """Merge config write kwargs with the writer-specific parameters."""
+        return self.config.get_write_kwargs()
 
     def __call__(self, dataset: "Dataset", path: str) -> None:
         """Write dataset to file."""
@@ -30,8 +37,7 @@ class Writer:
 class ParquetWriter(Writer):
     """Writer for Parquet files."""
 
-    def __call__(self, dataset: "Dataset", path: str) -> None:
-        """Write dataset to parquet file."""
+    def _build_write_kwargs(self) -> dict[str, Any]:
         write_kwargs = self.config.get_write_kwargs()
 
         # Handle parquet-specific parameters
@@ -46,15 +52,18 @@ class ParquetWriter(Writer):
         if "compression" not in write_kwargs:
             write_kwargs["compression"] = "snappy"
 
-        dataset.write_parquet(path, filesystem=get_fs(path, "pyarrow"), **write_kwargs)
+        return write_kwargs
+
+    def __call__(self, dataset: "Dataset", path: str) -> None:
+        """Write dataset to parquet file."""
+        dataset.write_parquet(path, filesystem=get_fs(path, "pyarrow"), **self._write_kwargs)
 
 
 @components.add("writer", "jsonl")
 class JSONLWriter(Writer):
     """Writer for JSONL files."""
 
-    def __call__(self, dataset: "Dataset", path: str) -> None:
-        """Write dataset to jsonl file."""
+    def _build_write_kwargs(self) -> dict[str, Any]:
         write_kwargs = self.config.get_write_kwargs()
 
         # Handle JSONL-specific parameters
@@ -62,15 +71,18 @@ class JSONLWriter(Writer):
             if key in self.params:
                 write_kwargs[key] = self.params[key]
 
-        dataset.write_json(path, filesystem=get_fs(path, "pyarrow"), **write_kwargs)
+        return write_kwargs
+
+    def __call__(self, dataset: "Dataset", path: str) -> None:
+        """Write dataset to jsonl file."""
+        dataset.write_json(path, filesystem=get_fs(path, "pyarrow"), **self._write_kwargs)
 
 
 @components.add("writer", "csv")
 class CSVWriter(Writer):
     """Writer for CSV files."""
 
-    def __call__(self, dataset: "Dataset", path: str) -> None:
-        """Write dataset to csv file."""
+    def _build_write_kwargs(self) -> dict[str, Any]:
         write_kwargs = self.config.get_write_kwargs()
 
         # Handle CSV-specific parameters
@@ -82,4 +94,8 @@ class CSVWriter(Writer):
         if "include_header" not in write_kwargs:
             write_kwargs["include_header"] = True
 
-        dataset.write_csv(path, filesystem=get_fs(path, "pyarrow"), **write_kwargs)
+        return write_kwargs
+
+    def __call__(self, dataset: "Dataset", path: str) -> None:
+        """Write dataset to csv file."""
+        dataset.write_csv(path, filesystem=get_fs(path, "pyarrow"), **self._write_kwargs)
@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from itertools import tee
 from typing import Any, Iterable
 
@@ -12,6 +14,48 @@ from llmdata.core.ops import MapFn, Row
 from llmdata.core.registry import components
 from llmdata.core.utils import get_field, set_field
 
+# Mersenne prime 2**31 - 1 used by the universal hash family. Reducing
+# modulo a Mersenne prime needs only shifts and adds (see _mersenne_reduce),
+# so no integer division runs in the MinHash inner loop. The modulus is
+# sized to the 31-bit shingle-hash domain: coefficients drawn over the full
+# [0, prime) range then keep a*h + b below 2**62, which single uint64 words
+# reduce exactly. A modulus wider than the coefficient range correlates the
+# permutations and biases the minhash estimate, so the two must match.
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_MERSENNE_SHIFT = np.uint64(31)
+# 64 - 31: folds the avalanche output into the [0, 2**31) hash domain
+_HASH_DOMAIN_SHIFT = np.uint64(33)
+
+# Shared hot-path scalars, built once at import: constructing a np.uint64
+# per call shows up in kernels that otherwise do a handful of vector ops
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX_MULT = np.uint64(0xFF51AFD7ED558CCD)
+_MIX_SHIFT = np.uint64(33)
+_U32_SHIFT = np.uint64(32)
+_U32_MASK = np.uint64(0xFFFFFFFF)
+_ONE = np.uint64(1)
+_BLOCK_H1_SHIFT = np.uint64(13)
+_BLOCK_H2_SHIFT = np.uint64(37)
+_BLOCK_BITS_MASK = np.uint64(511)
+_WORD_SHIFT = np.uint64(6)
+_WORD_MASK = np.uint64(63)
+
+# Below this many texts a batch is signed on the calling thread; the thread
+# pool only pays off once there is enough hashing work to split
+_PARALLEL_MIN_TEXTS = 64
+
+
+def _mersenne_reduce(x: "np.ndarray") -> "np.ndarray":
+    """Reduce uint64 values modulo 2**31 - 1 without division.
+
+    For x < 2**62, folding the top bits back onto the low 31 bits twice
+    leaves a value barely above the prime, so a single conditional
+    subtraction finishes the reduction.
+    """
+    x = (x & _MERSENNE_PRIME) + (x >> _MERSENNE_SHIFT)
+    x = (x & _MERSENNE_PRIME) + (x >> _MERSENNE_SHIFT)
+    return np.where(x >= _MERSENNE_PRIME, x - _MERSENNE_PRIME, x)
+
 
 class Signature:
     """BloomLSH signature."""
@@ -24,7 +68,6 @@ class Signature:
         num_bands: int,
         band_size: int,
         seed: int = 1854201893,
-        prime: int = 4294967311,
     ) -> None:
         self.threshold = threshold
         self.num_permutations = num_permutations
@@ -32,12 +75,35 @@ class Signature:
         self.num_bands = num_bands
         self.band_size = band_size
         self.num_hashes = self.num_bands * self.band_size
-        self.max_val = (1 << 32) - 1  # Largest possible hash value, uint32
-        self.prime = prime
-        # Set up permutation vectors
+        self.max_val = int(_MERSENNE_PRIME)  # Largest possible hash value: hashes live in [0, prime)
+        self.prime = int(_MERSENNE_PRIME)
+        # Set up permutation vectors. a and b must cover the full [0, prime)
+        # range: a smaller coefficient range makes a*h + b nearly monotone in
+        # h, correlating the permutations and biasing the minhash estimate.
+        # uint32 storage is sufficient precisely because the prime is 31-bit;
+        # it halves the memory-bound table multiply's read traffic, and the
+        # mixed uint64*uint32 arithmetic still promotes to uint64.
         np.random.seed(seed)
-        self.a = np.random.randint(1, self.max_val, self.num_permutations, dtype=np.uint64)
-        self.b = np.random.randint(0, self.max_val, self.num_permutations, dtype=np.uint64)
+        self.a = np.random.randint(1, self.prime, self.num_permutations, dtype=np.uint32)
+        self.b = np.random.randint(0, self.prime, self.num_permutations, dtype=np.uint32)
+        # Scratch rows reused by the accumulating MinHash path
+        self._scratch_cand = np.empty(self.num_permutations, dtype=np.uint64)
+        self._scratch_hi = np.empty(self.num_permutations, dtype=np.uint64)
+        # Default output buffers for the single-text pipeline; __call__ hands
+        # out an owned uint32 copy, so steady state allocates nothing else
+        self._sig_buf = np.empty(self.num_permutations, dtype=np.uint64)
+        self._band_buf = np.empty(self.num_bands, dtype=np.uint64)
+        # Odd per-position multipliers for mixing each band into one hash
+        self._band_mult = (np.random.randint(1, self.max_val, self.band_size, dtype=np.uint64) * _GOLDEN) | _ONE
+        # Odd per-position multipliers for combining word hashes into shingle
+        # hashes; position-dependence keeps the combine order-sensitive
+        self._shingle_mult = (np.random.randint(1, self.max_val, self.ngrams, dtype=np.uint64) * _GOLDEN) | _ONE
+        # Memo of recent band signatures keyed by a 128-bit text digest, so
+        # repeated paragraphs skip the whole shingle/MinHash pipeline. Plain
+        # dict with FIFO eviction; insertion order makes the oldest entry the
+        # first key.
+        self._cache: dict[int, "np.ndarray"] = {}
+        self._cache_size = 1024
 
     def _get_ngrams(self, sequence: list[str]) -> Iterable:
         """Construct ngrams for a given list of tokens. Directly taken from nltk package to avoid dependency."""
@@ -57,47 +123,167 @@ class Signature:
         else:
             return {" ".join(ng) for ng in self._get_ngrams(words)}
 
+    def _get_shingle_hashes(self, text: str) -> "np.ndarray":
+        """Hash the text's shingles into a deduplicated uint64 array.
+
+        Emitting pre-hashed values instead of a set of strings keeps the
+        downstream MinHash kernel working on one contiguous array.
+        """
+        words = text.split()
+        # Hash each word exactly once (mmh3 encodes str arguments to UTF-8 in
+        # C); every word used to be re-hashed as part of up to ngrams joined
+        # gram strings, each of which was a fresh Python str
+        word_hashes = np.fromiter(
+            (mmh3.hash(word, signed=False) for word in words),
+            dtype=np.uint64,
+            count=len(words),
+        )
+        # Combine each window with position-dependent multipliers and an
+        # avalanche, then keep the high 31 bits: downstream universal hashing
+        # works modulo the 31-bit Mersenne prime, so shingle hashes must stay
+        # inside that domain for a*h + b to reduce exactly in uint64.
+        # The combine runs as one shifted 1D multiply-add per window position
+        # rather than materializing a (windows x ngrams) product table, so
+        # every pass streams over contiguous memory.
+        if word_hashes.size < self.ngrams:
+            mixed = (word_hashes * self._shingle_mult[: word_hashes.size]).sum(dtype=np.uint64, keepdims=True)
+        else:
+            num_windows = word_hashes.size - self.ngrams + 1
+            mixed = word_hashes[:num_windows] * self._shingle_mult[0]
+            for i in range(1, self.ngrams):
+                mixed += word_hashes[i : i + num_windows] * self._shingle_mult[i]
+        mixed ^= mixed >> _MIX_SHIFT
+        mixed *= _MIX_MULT
+        mixed ^= mixed >> _MIX_SHIFT
+        return np.unique(mixed >> _HASH_DOMAIN_SHIFT)
+
     def _get_minhash_signature(self, shingles: set[str]) -> "np.ndarray":
-        """Compute the MinHash signature for a given text."""
+        """Compute the MinHash signature for a given shingle set.
+
+        Legacy string-set entry point; the signature pipeline itself runs on
+        the string-free _get_shingle_hashes arrays.
+        """
         # Return 0 if empty shingle set
         if not shingles:
             return np.zeros(self.num_permutations, dtype=np.uint64)
-        # Initialize signature with maximum values
-        signature = np.full(self.num_permutations, self.max_val, dtype=np.uint64)
-        # Update signature with each shingle
-        for shingle in shingles:
-            shingle_hash = mmh3.hash(shingle.encode("utf-8"), signed=False)
-            hashes = ((self.a * shingle_hash + self.b) % self.prime) % self.max_val
-            signature = np.minimum(signature, hashes)
-        return signature
-
-    def _get_band_signature(self, minhash_signature: "np.ndarray") -> "np.ndarray":
-        """Compute the band signature for a given minhash signature."""
-        # Split into bands
-        bands = np.array_split(minhash_signature, self.num_bands)
-        # Compute each bands' individual hashes
-        band_hashes = np.zeros(shape=(self.num_bands,), dtype=np.uint64)
-        for band_idx, band in enumerate(bands):
-            for hash in band:
-                band_hashes[band_idx] += mmh3.hash(hash.tobytes(), signed=False)
-            band_hashes[band_idx] = band_hashes[band_idx] % self.max_val
-
-        return band_hashes
+        # mmh3 is 32-bit; drop a bit to land in the [0, 2**31) hash domain
+        shingle_hashes = np.fromiter(
+            (mmh3.hash(shingle, signed=False) >> 1 for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # Copy out of the shared signature buffer: unlike the internal
+        # callers, users of this entry point may hold onto the result
+        return self._minhash_from_hashes(shingle_hashes).copy()
+
+    def _minhash_from_hashes(self, shingle_hashes: "np.ndarray", out: "np.ndarray | None" = None) -> "np.ndarray":
+        """Compute the MinHash signature from pre-hashed shingles.
+
+        Writes into ``out`` (the preallocated instance buffer by default), so
+        repeated calls allocate nothing; callers that keep the result past
+        the next call must copy it.
+        """
+        if out is None:
+            out = self._sig_buf
+        if shingle_hashes.size == 0:
+            out.fill(0)
+            return out
+        # For short texts the broadcast table's allocation dominates, so fold
+        # shingle by shingle instead; both paths give identical signatures
+        if shingle_hashes.size < 32:
+            signature = out
+            signature.fill(_MERSENNE_PRIME)
+            cand, hi = self._scratch_cand, self._scratch_hi
+            for shingle_hash in shingle_hashes:
+                # Build each candidate row in the reused scratch buffers and
+                # fold it in with a branchless in-place minimum; the Mersenne
+                # reduction is spelled out so every step stays allocation-free
+                np.multiply(self.a, shingle_hash, out=cand)
+                cand += self.b
+                np.right_shift(cand, _MERSENNE_SHIFT, out=hi)
+                cand &= _MERSENNE_PRIME
+                cand += hi
+                np.right_shift(cand, _MERSENNE_SHIFT, out=hi)
+                cand &= _MERSENNE_PRIME
+                cand += hi
+                cand[cand >= _MERSENNE_PRIME] -= _MERSENNE_PRIME
+                np.minimum(signature, cand, out=signature)
+            return signature
+        # One (shingles x permutations) table replaces the per-shingle Python
+        # loop; products stay below 2**62 since hashes and a/b are 31-bit
+        table = _mersenne_reduce(shingle_hashes[:, None] * self.a + self.b)
+        return table.min(axis=0, out=out)
+
+    def _get_band_signature(self, minhash_signature: "np.ndarray", out: "np.ndarray | None" = None) -> "np.ndarray":
+        """Compute the band signature for a given minhash signature.
+
+        Writes into ``out`` (the preallocated instance buffer by default);
+        the same copy-before-keeping caveat as _minhash_from_hashes applies.
+        """
+        if out is None:
+            out = self._band_buf
+        # Mix each band's values into one hash: a per-position multiply-sum
+        # followed by an avalanche, all vectorized across bands. uint64
+        # arithmetic wraps mod 2**64, which is exactly what a mix wants.
+        rows = minhash_signature.reshape(self.num_bands, self.band_size)
+        np.sum(rows * self._band_mult, axis=1, dtype=np.uint64, out=out)
+        out ^= out >> _MIX_SHIFT
+        out *= _MIX_MULT
+        out ^= out >> _MIX_SHIFT
+        # Mask instead of modulo: the filter only needs 32-bit band values,
+        # and its block mapping is a fastrange multiply-shift, not a mod
+        out &= _U32_MASK
+        return out
+
+    def batch(self, texts: "list[str]") -> "np.ndarray":
+        """Compute BloomLSH signatures for several texts in one pass.
+
+        Concatenates every text's shingle hashes into one array, evaluates the
+        permutation table once and reduces per-document minima with a grouped
+        reduceat, then mixes all bands together — one NumPy pipeline instead
+        of a Python loop over documents.
+        """
+        if not texts:
+            return np.zeros((0, self.num_bands), dtype=np.uint32)
+        hash_arrays = [self._get_shingle_hashes(text) for text in texts]
+        counts = np.fromiter((h.size for h in hash_arrays), dtype=np.int64, count=len(hash_arrays))
+        all_hashes = np.concatenate(hash_arrays)
+        table = _mersenne_reduce(all_hashes[:, None] * self.a + self.b)
+        offsets = np.zeros(len(texts), dtype=np.int64)
+        np.cumsum(counts[:-1], out=offsets[1:])
+        signatures = np.minimum.reduceat(table, offsets, axis=0)
+        # Band mixing, vectorized across documents
+        rows = signatures.reshape(len(texts), self.num_bands, self.band_size)
+        mixed = (rows * self._band_mult).sum(axis=2, dtype=np.uint64)
+        mixed ^= mixed >> _MIX_SHIFT
+        mixed *= _MIX_MULT
+        mixed ^= mixed >> _MIX_SHIFT
+        return (mixed & _U32_MASK).astype(np.uint32)
 
     def __call__(self, text: str) -> "np.ndarray":
         """Compute the BloomLSH signature for a given text."""
-        # Compute shingles
-        shingles = self._get_shingles(text)
-        # Compute minhash signature of shingle set
-        signature = self._get_minhash_signature(shingles)
+        key = mmh3.hash128(text, signed=False)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        # Compute minhash signature over the hashed shingles
+        signature = self._minhash_from_hashes(self._get_shingle_hashes(text))
         # Compute Bloom bands
-        bands = self._get_band_signature(signature)
-        return bands.astype(np.uint32)  # Ensure uint32 for bloom filter
+        bands = self._get_band_signature(signature).astype(np.uint32)  # Ensure uint32 for bloom filter
+        if len(self._cache) >= self._cache_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = bands
+        return bands
 
 
 class BandedBloomFilter:
     """Implementation of a bloom filter specifically for BloomLSH.
 
+    Filter state is a NumPy uint64 bitset: one (num_blocks, 8) plane of
+    64-bit words per band, where a bit lives at word ``bit >> 6`` under mask
+    ``1 << (bit & 63)``. Set and test are branchless OR/AND over whole
+    blocks, with no Python-int bit arithmetic anywhere in the probe path.
+
     TODO: This currently does not scale for large-ish datasets.
     """
 
@@ -109,7 +295,6 @@ class BandedBloomFilter:
         lsh_threshold: float,
         lsh_ngram_size: int,
         lsh_seed: int = 1854201893,
-        lsh_prime: int = 4294967311,
     ) -> None:
         # Parameters for MinHash Signature
         self.lsh_permutations = lsh_permutations
@@ -128,10 +313,20 @@ class BandedBloomFilter:
             num_bands=self.num_bands,
             band_size=self.band_size,
             seed=lsh_seed,
-            prime=lsh_prime,
         )
-        # Filter state
-        self.state = np.zeros((self.num_bands, self.bloom_size), dtype=bool)
+        # Filter state: blocked layout, one 64-byte block (8 qwords = 512
+        # bits) per slot so every put/get touches a single cache line
+        # instead of bloom_hashes scattered ones
+        self.num_blocks = max(1, self.bloom_size // 512)
+        self.state = np.zeros((self.num_bands, self.num_blocks, 8), dtype=np.uint64)
+        # Index vectors and specialized scalars reused by every probe
+        self._probe_steps = np.arange(self.bloom_hashes, dtype=np.uint64)
+        self._band_indices = np.arange(self.num_bands)
+        self._probe_rows = np.repeat(self._band_indices, self.bloom_hashes)
+        self._num_blocks_u64 = np.uint64(self.num_blocks)
+        # Worker pool for signing large batches, created on first use
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_workers = min(8, os.cpu_count() or 1)
 
     def _set_bands(self) -> tuple[int, int]:
         """Calculate optimal band number and band size for given similarity threshold."""
@@ -150,29 +345,83 @@ class BandedBloomFilter:
 
         return best_b, best_r
 
-    def _hashes(self, item: np.uint32) -> list[int]:
-        return [mmh3.hash(item.tobytes(), i) % self.bloom_size for i in range(self.bloom_hashes)]
+    def _block_probes(self, band_values: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+        """Map every band hash to its block index and 512-bit probe mask.
+
+        Blocks come from a fastrange reduction of the 32-bit hashes; the
+        bloom_hashes probe bits are derived inside each block by double
+        hashing. Everything is computed for all bands in one shot, so a
+        membership test is a single gather plus one vectorized compare.
+        """
+        values = band_values.astype(np.uint64)
+        blocks = (values * self._num_blocks_u64) >> _U32_SHIFT
+        mixed = values * _GOLDEN
+        h1 = mixed >> _BLOCK_H1_SHIFT
+        h2 = (mixed >> _BLOCK_H2_SHIFT) | _ONE
+        bits = (h1[:, None] + self._probe_steps * h2[:, None]) & _BLOCK_BITS_MASK
+        masks = np.zeros((values.size, 8), dtype=np.uint64)
+        np.bitwise_or.at(masks, (self._probe_rows, (bits >> _WORD_SHIFT).ravel()), _ONE << (bits & _WORD_MASK).ravel())
+        return blocks, masks
 
     def _signature(self, val: str) -> "np.ndarray":
         """Compute the signature for an incoming string."""
         return self.signature(val)
 
+    def _batch_signatures(self, texts: "list[str]") -> "np.ndarray":
+        """Sign a batch of texts, fanning large batches out to worker threads.
+
+        mmh3 and the NumPy kernels release the GIL, so the pure signature
+        work scales across threads; Signature.batch keeps no shared scratch
+        state, which makes the chunks independent. Filter reads and writes
+        stay on the calling thread.
+        """
+        if len(texts) < _PARALLEL_MIN_TEXTS or self._pool_workers < 2:
+            return self.signature.batch(texts)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._pool_workers)
+        chunk_size = -(-len(texts) // self._pool_workers)
+        chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        return np.vstack(list(self._pool.map(self.signature.batch, chunks)))
+
     def put(self, data: str) -> None:
         """Add a signature to the bloom filter."""
-        band_values = self._signature(data)
-        for band_idx, value in enumerate(band_values):
-            hash_indices = self._hashes(value)
-            self.state[band_idx, hash_indices] = True
+        blocks, masks = self._block_probes(self._signature(data))
+        self.state[self._band_indices, blocks] |= masks
 
     def get(self, data: str) -> bool:
         """Check bloom filter for matches on given signature."""
-        # Return first matching signature or None
-        band_values = self._signature(data)
-        for band_idx, value in enumerate(band_values):
-            hash_indices = self._hashes(value)
-            if np.all(self.state[band_idx, hash_indices]):
-                return True  # type: ignore
-        return False
+        blocks, masks = self._block_probes(self._signature(data))
+        gathered = self.state[self._band_indices, blocks]
+        # A band matches when all of its probe bits are set. All probes for a
+        # band live in one gathered block, so the single compare below already
+        # resolves every probe at once; there is no cheaper per-probe exit.
+        return bool(((gathered & masks) == masks).all(axis=1).any())
+
+    def check_and_put(self, texts: "list[str]") -> "list[bool]":
+        """Check several texts at once, inserting the novel ones.
+
+        Signatures for the whole batch are computed in one vectorized pass;
+        the filter itself is probed and updated sequentially so that a
+        duplicate later in the batch sees its earlier occurrence.
+
+        Returns:
+            Keep flags: True where the text was unseen (and is now added)
+        """
+        band_matrix = self._batch_signatures(texts)
+        band_indices = self._band_indices
+        keep = []
+        for band_values in band_matrix:
+            blocks, masks = self._block_probes(band_values)
+            gathered = self.state[band_indices, blocks]
+            # All bands are probed in one gather + compare; a Python loop
+            # that stopped at the first matching band would pay more per
+            # band than this resolves for the whole document
+            if ((gathered & masks) == masks).all(axis=1).any():
+                keep.append(False)
+            else:
+                self.state[band_indices, blocks] |= masks
+                keep.append(True)
+        return keep
 
 
 @remote
@@ -233,16 +482,9 @@ class DeduplicationFormatter(MapFn):
         if not text:
             return row
         paragraphs = text.split(self.split_char) if self.split_char is not None else [text]
-        unique = []
-        for paragraph in paragraphs:
-            match = ray.get(self._actor.get.remote(paragraph))
-            if match is None:
-                # No matches - insert it and keep it
-                ray.get(self._actor.put.remote(paragraph))
-                unique.append(True)
-            else:
-                # Matches existing - don't insert, mark as duplicate
-                unique.append(False)
+        # One round trip to the filter actor per document: novel paragraphs
+        # are inserted and flagged True, duplicates flagged False
+        unique = ray.get(self._actor.check_and_put.remote(paragraphs))
         if not any(unique):
             set_field(row, self.to, "")
         else:
@@ -1,15 +1,17 @@
+import functools
 import logging
 import re
-from typing import Any, Literal
+from typing import Any, Iterable, Iterator, Literal
 
+import numpy as np
 import ray
 from presidio_analyzer import AnalyzerEngine
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import OperatorConfig
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from ray.util.actor_pool import ActorPool
 
-from llmdata.core.ops import MapFn, Row
+from llmdata.core.ops import Batch, MapBatchesFn, MapFn, Row
 from llmdata.core.registry import components
 from llmdata.core.utils import get_field, set_field, silence
 
@@ -316,19 +318,50 @@ def get_pii_regex_str() -> str:  # noqa
     )
 
 
-# Regex patterns for PII detection
-PII_REGEX_PATTERNS = {
-    "CREDIT_CARD": re.compile("\\b(?:\\d{4}[-\\s]?){3}\\d{4}\\b"),
-    "IBAN_CODE": re.compile(get_pii_regex_str()),
-    "EMAIL_ADDRESS": re.compile("[.\\s@,?!;:)(]*([^\\s@]+@[^\\s@,?!;:)(]+?)[.\\s@,?!;:)(]?[\\s\n\r]"),
-    "PHONE_NUMBER": re.compile("\\s+\\(?(\\d{3})\\)?[-\\. ]*(\\d{3})[-. ]?(\\d{4})"),
-    "IP_ADDRESS": re.compile(
-        "(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
-    ),
-    "URL": re.compile(
-        "(?i)\b((?:https?://|www\\d{0,3}[.]|[a-z0-9.\\-]+[.][a-z]{2,4}/)(?:[^\\s()<>]+|\\(([^\\s()<>]+|(\\([^\\s()<>]+\\)))*\\))+(?:\\(([^\\s()<>]+|(\\([^\\s()<>]+\\)))*\\)|[^\\s`!()\\[\\]{};:'\".,<>?«»“”‘’]))"  # noqa
-    ),
-}
+@functools.cache
+def get_pii_patterns() -> dict[str, re.Pattern]:
+    """Compile the PII detection patterns once per process.
+
+    Compiling lazily (instead of at module import) keeps the large IBAN
+    alternation off the import path of Ray workers that never run a PII
+    formatter; the cache makes all formatter instances in a process share
+    one compiled set.
+    """
+    return {
+        # Anchored via lookarounds instead of \b / \s+ with nested quantifiers, so
+        # long digit runs (tables, base64-ish crawl junk) fail fast instead of
+        # backtracking catastrophically.
+        "CREDIT_CARD": re.compile(r"(?:(?<=\D)|^)\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}(?:(?=\D)|$)", re.ASCII),
+        "IBAN_CODE": re.compile(get_pii_regex_str()),
+        "EMAIL_ADDRESS": re.compile("[.\\s@,?!;:)(]*([^\\s@]+@[^\\s@,?!;:)(]+?)[.\\s@,?!;:)(]?[\\s\n\r]"),
+        "PHONE_NUMBER": re.compile(r"(?:(?<=\s)|^)\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})(?=\D|$)"),
+        "IP_ADDRESS": re.compile(
+            "(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
+        ),
+        "URL": re.compile(
+            "(?i)\b((?:https?://|www\\d{0,3}[.]|[a-z0-9.\\-]+[.][a-z]{2,4}/)(?:[^\\s()<>]+|\\(([^\\s()<>]+|(\\([^\\s()<>]+\\)))*\\))+(?:\\(([^\\s()<>]+|(\\([^\\s()<>]+\\)))*\\)|[^\\s`!()\\[\\]{};:'\".,<>?«»“”‘’]))"  # noqa
+        ),
+    }
+
+
+def _serialize_spacy_model(nlp: Any) -> tuple[Any, bytes]:
+    """Capture a spaCy pipeline as a (config, bytes) payload for shipping."""
+    return nlp.config, nlp.to_bytes()
+
+
+def _deserialize_spacy_model(payload: tuple[Any, bytes]) -> Any:
+    """Rebuild a spaCy pipeline from a (config, bytes) payload.
+
+    Language.from_bytes only loads data into components that already exist
+    on the receiving pipeline, and a blank pipeline has none — so the
+    component stack must first be reconstructed from the config before the
+    weights are restored.
+    """
+    import spacy
+
+    config, model_bytes = payload
+    lang_cls = spacy.util.get_lang_class(config["nlp"]["lang"])
+    return lang_cls.from_config(config).from_bytes(model_bytes)
 
 
 @ray.remote
@@ -347,6 +380,7 @@ class PresidioPIIActor:
         anonymization_method: str = "replace",
         entity_methods: dict[str, str] | None = None,
         nlp_engine_name: str = "spacy",
+        model_payload_ref: ray.ObjectRef | None = None,
     ):
         self.entity_types = entity_types
         self.language = language
@@ -354,26 +388,43 @@ class PresidioPIIActor:
         self.anonymization_method = anonymization_method
         self.entity_methods = entity_methods or {}
         self.nlp_engine_name = nlp_engine_name
+        self.model_payload_ref = model_payload_ref
         self._analyzer: AnalyzerEngine | None = None
         self._anonymizer: AnonymizerEngine | None = None
         self._method_configs: dict[str, Any] | None = None
         self._defaults = PII_DEFAULTS[language]
 
+    def _create_nlp_engine(self) -> Any:
+        """Build the NLP engine, preferring a pre-serialized model from the object store.
+
+        When the driver shipped the spaCy pipeline as a (config, bytes)
+        payload (see `PresidioPIIActorPool`), rebuild it from that instead of
+        re-loading the model package from disk in every actor.
+        """
+        from presidio_analyzer.nlp_engine import NlpEngineProvider, SpacyNlpEngine
+
+        if self.nlp_engine_name == "spacy" and self.model_payload_ref is not None:
+            nlp = _deserialize_spacy_model(ray.get(self.model_payload_ref))
+            nlp_engine = SpacyNlpEngine(models=[{"lang_code": self.language, "model_name": f"{self.language}_core_news_sm"}])
+            nlp_engine.nlp = {self.language: nlp}
+            return nlp_engine
+
+        return NlpEngineProvider(
+            nlp_configuration={
+                "nlp_engine_name": self.nlp_engine_name,
+                "models": [{"lang_code": self.language, "model_name": f"{self.language}_core_news_sm"}],
+            }
+        ).create_engine()
+
     def _setup(self) -> bool:
         """Initialize Presidio components (called once per actor)."""
         from presidio_analyzer import AnalyzerEngine
-        from presidio_analyzer.nlp_engine import NlpEngineProvider
         from presidio_anonymizer import AnonymizerEngine
 
         try:
             with silence():  # Suppress presidio setup logs
                 # Configure NLP engine
-                nlp_engine = NlpEngineProvider(
-                    nlp_configuration={
-                        "nlp_engine_name": self.nlp_engine_name,
-                        "models": [{"lang_code": self.language, "model_name": f"{self.language}_core_news_sm"}],
-                    }
-                ).create_engine()
+                nlp_engine = self._create_nlp_engine()
 
                 self._method_configs = {
                     "redact": OperatorConfig("redact", {}),
@@ -458,6 +509,20 @@ class PresidioPIIActorPool:
         self.entity_methods = entity_methods or {}
         self.nlp_engine_name = nlp_engine_name
 
+        # Load the spaCy pipeline once on the driver and share it through the
+        # object store, so actors rebuild it from memory instead of each
+        # re-loading the model package from disk.
+        model_payload_ref: ray.ObjectRef | None = None
+        if self.nlp_engine_name == "spacy":
+            try:
+                import spacy
+
+                with silence():
+                    nlp = spacy.load(f"{self.language}_core_news_sm")
+                model_payload_ref = ray.put(_serialize_spacy_model(nlp))
+            except Exception as e:
+                logger.warning(f"Could not pre-load spaCy model on driver, actors will load from disk: {e}")
+
         self._actors: list[ray.actor.ActorHandle] = []
         for i in range(self.pool_size):
             self._actors.append(
@@ -468,6 +533,7 @@ class PresidioPIIActorPool:
                     anonymization_method=self.anonymization_method,
                     entity_methods=self.entity_methods,
                     nlp_engine_name=self.nlp_engine_name,
+                    model_payload_ref=model_payload_ref,
                 )
             )
 
@@ -487,6 +553,15 @@ class PresidioPIIActorPool:
         result: str = self._actor_pool.get_next()
         return result
 
+    def map(self, texts: Iterable[str]) -> Iterator[str]:
+        """Process texts concurrently, keeping pool_size requests in flight.
+
+        Unlike __call__, which blocks on every single text and degenerates the
+        pool to one request in flight, this keeps all actors busy. Results are
+        yielded in submission order.
+        """
+        yield from self._actor_pool.map(lambda actor, txt: actor.__call__.remote(txt), texts)
+
     def shutdown(self) -> None:
         """Shutdown the actor pool."""
         # Ray's ActorPool doesn't have a shutdown method, just clear reference
@@ -583,6 +658,46 @@ class PresidioPIIFormatter(MapFn):
         return row
 
 
+@components.add("format", "pii_presidio_batch")
+class PresidioPIIBatchFormatter(PresidioPIIFormatter, MapBatchesFn):
+    """Batched variant of PresidioPIIFormatter.
+
+    Feeds a whole column of texts through the actor pool at once via
+    PresidioPIIActorPool.map, so pool_size requests are in flight
+    concurrently instead of one blocking round-trip per row.
+    """
+
+    name: str = Field(default="pii_formatter_actor_batch", description="Name of the formatter")
+
+    def __call__(self, batch: Batch) -> Batch:  # type: ignore[override]
+        """Analyze a batch of texts and remove PII using the actor pool."""
+        texts = batch[self.on]
+        try:
+            actor_pool = _get_or_create_actor_pool(
+                pool_size=self.pool_size,
+                entity_types=list(self.entity_types),
+                language=self.language,
+                confidence_threshold=self.confidence_threshold,
+                anonymization_method=self.anonymization_method,
+                entity_methods=self.entity_methods,
+                nlp_engine_name=self.nlp_engine_name,
+            )
+            processed = list(actor_pool.map(str(text) if text else "" for text in texts))
+        except Exception as e:
+            logger.error(f"Failed to process PII batch with actor pool: {e}")
+            processed = list(texts)
+
+        batch[self.to] = np.fromiter(
+            (new if text else text for text, new in zip(texts, processed)), dtype=object, count=len(texts)
+        )
+        if self.flag is not None:
+            # something was done to the text, i.e. there was PII
+            batch[self.flag] = np.fromiter(
+                (text != new for text, new in zip(texts, batch[self.to])), dtype=bool, count=len(texts)
+            )
+        return batch
+
+
 @components.add("format", "pii_regex")
 class RegexPIIFormatter(MapFn):
     """Removes personal identifiable information (PII) from text."""
@@ -605,34 +720,37 @@ class RegexPIIFormatter(MapFn):
         description="Optional column name to insert a binary flag into indicating if PII was found in this document.",
     )
 
+    _subs: tuple[tuple[re.Pattern, str], ...] = PrivateAttr()
+
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
         if self.language not in PII_DEFAULTS:
             raise ValueError(f"Unsupported language: {self.language}. Available: {list(PII_DEFAULTS.keys())}")
 
+    def model_post_init(self, *args: Any, **kwargs: dict[str, Any]) -> None:
+        """Precompute the (pattern, replacement) pairs in a stable order.
+
+        The configured entity_types set has nondeterministic iteration order;
+        fixing the order (roughly by expected hit rate) and resolving the
+        replacement strings once keeps the per-row loop a bare pattern.sub.
+        """
+        defaults = PII_DEFAULTS.get(self.language, {})
+        patterns = get_pii_patterns()
+        self._subs = tuple(
+            (patterns[et], "" if self.anonymization_method == "redact" else defaults.get(et, ""))
+            for et in ("EMAIL_ADDRESS", "URL", "CREDIT_CARD", "IP_ADDRESS", "PHONE_NUMBER", "IBAN_CODE")
+            if et in self.entity_types and et in patterns
+        )
+
     def _process(self, text: str) -> str:
         """Process text to detect and replace/redact PII using regex patterns."""
         if not text:
             return text
 
-        processed_text = text
-        defaults = PII_DEFAULTS.get(self.language, {})
-
-        for entity_type in self.entity_types:
-            if entity_type not in PII_REGEX_PATTERNS:
-                continue
-
-            pattern = PII_REGEX_PATTERNS[entity_type]
-
-            if self.anonymization_method == "redact":
-                # Redact by replacing with empty string
-                processed_text = pattern.sub("", processed_text)
-            else:  # replace
-                # Replace with default value for the language
-                replacement = defaults.get(entity_type, "")
-                processed_text = pattern.sub(replacement, processed_text)
+        for pattern, replacement in self._subs:
+            text = pattern.sub(replacement, text)
 
-        return processed_text
+        return text
 
     def __call__(self, row: Row) -> Row:
         """Analyze text and remove PII using regexes."""
@@ -647,3 +765,30 @@ class RegexPIIFormatter(MapFn):
             set_field(row, self.flag, flag)
 
         return row
+
+
+@components.add("format", "pii_regex_batch")
+class RegexPIIBatchFormatter(RegexPIIFormatter, MapBatchesFn):
+    """Batched variant of RegexPIIFormatter.
+
+    Processes a whole column of texts per call via map_batches, so each
+    pattern substitution runs across the batch inside a single Python frame
+    instead of paying per-row dispatch overhead.
+    """
+
+    name: str = Field(default="pii_formatter_batch", description="Name of the formatter")
+
+    def __call__(self, batch: Batch) -> Batch:  # type: ignore[override]
+        """Analyze a batch of texts and remove PII using regexes."""
+        texts = batch[self.on]
+        process = self._process
+        processed = np.fromiter(
+            (process(text) if text else text for text in texts), dtype=object, count=len(texts)
+        )
+        batch[self.to] = processed
+        if self.flag is not None:
+            # something was done to the text, i.e. there was PII
+            batch[self.flag] = np.fromiter(
+                (text != new for text, new in zip(texts, processed)), dtype=bool, count=len(texts)
+            )
+        return batch
@@ -1,7 +1,7 @@
 import uuid
-from typing import Any, List
+from typing import Any, Callable, List
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from llmdata.core.ops import MapFn, Row
 from llmdata.core.registry import components
@@ -35,28 +35,44 @@ class BaseIngestor(MapFn):
     )
     other: list[str] | None = Field(default=None, description="Other columns to include")
 
+    _build: Callable[[Row], Row] = PrivateAttr()
+
+    def model_post_init(self, *args: Any, **kwargs: dict[str, Any]) -> None:
+        """Precompile the row-building closure.
+
+        The output shape is fully determined by the configuration, so the
+        per-row work is assembled once here with all column names bound as
+        locals instead of re-reading attributes and re-testing the optional
+        fields on every row.
+        """
+        id_col = self.id_column
+        text_col = self.text_column
+        source_col = self.source_name_or_column
+        subset_col = self.subset_name_or_column
+        license_col = self.license_name_or_column
+        other_cols = tuple(self.other) if self.other else ()
+        uuid4 = uuid.uuid4
+
+        def build(row: Row) -> Row:
+            updated_row: dict[str, Any] = {
+                "id": str(get_field(row, id_col)) or str(uuid4().hex),
+                "text": get_field(row, text_col) or "",
+                "source": get_field(row, source_col) or source_col,
+                "metadata": {},
+            }
+            for col in other_cols:  # Do it first in case it's the metadata column
+                updated_row[col] = get_field(row, col)
+            if subset_col:
+                updated_row["metadata"]["subset"] = get_field(row, subset_col) or subset_col  # type: ignore[index]
+            if license_col:
+                updated_row["metadata"]["license"] = get_field(row, license_col) or license_col  # type: ignore[index]
+            return updated_row
+
+        self._build = build
+
     def __call__(self, row: Row) -> Row:
         """Ingests data to llmdata schema format."""
-        # Test if license is column or name
-        updated_row: dict[str, Any] = {
-            "id": str(get_field(row, self.id_column)) or str(uuid.uuid4().hex),
-            "text": get_field(row, self.text_column) or "",
-            "source": get_field(row, self.source_name_or_column) or self.source_name_or_column,
-            "metadata": {},
-        }
-        if self.other:  # Do it first in case it's the metadata column
-            for col in self.other:
-                updated_row[col] = get_field(row, col)
-        if self.subset_name_or_column:
-            updated_row["metadata"]["subset"] = (  # type: ignore[index]
-                get_field(row, self.subset_name_or_column) or self.subset_name_or_column
-            )
-        if self.license_name_or_column:
-            updated_row["metadata"]["license"] = (  # type: ignore[index]
-                get_field(row, self.license_name_or_column) or self.license_name_or_column
-            )
-
-        return updated_row
+        return self._build(row)
 
 
 __all__ = ["BaseIngestor"]
@@ -1,10 +1,33 @@
+import functools
 from typing import Any
 
+import numpy as np
 from pydantic import Field
 
-from llmdata.core.ops import MapFn, Row
+from llmdata.core.ops import Batch, MapBatchesFn, MapFn, Row
 from llmdata.core.registry import components
-from llmdata.core.utils import get_field, set_field
+from llmdata.core.utils import download_to_cache, get_field, set_field
+
+DEFAULT_FASTTEXT_URL = "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin"
+
+
+def _unknown_result() -> dict[str, list]:
+    """Fallback result for empty or undetectable text."""
+    return {"names": ["unknown"], "scores": [0.0]}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_fasttext(model_path: str | None):  # type: ignore[no-untyped-def]
+    """Load a FastText model once per process, shared across tagger instances.
+
+    The lid.176.bin model is ~126MB in memory; caching by path keeps one copy
+    per process no matter how many LanguageTagger instances exist.
+    """
+    from fasttext.FastText import _FastText
+
+    if model_path is None:
+        model_path = download_to_cache(DEFAULT_FASTTEXT_URL)
+    return _FastText(model_path)
 
 
 @components.add("tag", "language")
@@ -42,72 +65,104 @@ class LanguageTagger(MapFn):
     def model(self):  # type: ignore
         """The underlying FastText detection model."""
         if self._model is None:
-            from urllib.request import urlretrieve
-
-            from fasttext.FastText import _FastText
-
-            model_path, _ = urlretrieve("https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin")  # nosec
-            self._model = _FastText(model_path)
+            self._model = _load_fasttext(self.fasttext_model_path)
         return self._model
 
+    def prewarm(self) -> None:
+        """Load the model in the current process.
+
+        Intended as a pool initializer (fork-after-load) so workers inherit
+        the loaded lid.176.bin pages instead of each loading their own copy.
+        """
+        self.model  # noqa: B018
+
+    def _prepare(self, text: str | None) -> str | None:
+        """Return the single-line, truncated detection input, or None if empty."""
+        if not text or text.isspace():
+            return None
+
+        # Truncate first so work is bounded by max_tokens, not document
+        # length. FastText expects a single line, so replace newlines with
+        # spaces; surrounding whitespace is fine for predict, so skip the
+        # extra strip() pass over the string.
+        return text[: self.max_tokens].replace("\n", " ")
+
+    def _result(self, labels: list, raw_scores: list) -> dict[str, list]:
+        """Convert raw FastText predictions into the tagged result dict."""
+        languages: list = [pred.replace("__label__", "") for pred in labels]
+        scores: list = list(raw_scores)
+
+        # Filter by confidence lsh_threshold
+        if self.confidence_threshold > 0:
+            filtered_results = [
+                (lang, score)
+                for lang, score in zip(languages, scores, strict=False)
+                if score >= self.confidence_threshold
+            ]
+            if filtered_results:
+                languages, scores = zip(*filtered_results, strict=False)  # type: ignore[assignment]
+                languages, scores = list(languages), list(scores)
+            else:
+                languages, scores = ["unknown"], [0.0]
+
+        return {"names": languages, "scores": scores}
+
     def __call__(self, row: Row) -> Row:
         """Add language detection to metadata."""
-        text = get_field(row, self.on)
-        if not text or not text.strip():
-            set_field(
-                row,
-                self.to,
-                {
-                    "names": ["unknown"],
-                    "scores": [0.0],
-                },
-            )
+        text_for_detection = self._prepare(get_field(row, self.on))
+        if text_for_detection is None:
+            set_field(row, self.to, _unknown_result())
             return row
 
-        # FastText expects single line, replace newlines with spaces
-        text_for_detection = text.replace("\n", " ").strip()
+        # Read the cached model directly; the property (None check + call)
+        # only has to run until the first row has triggered the load
+        model = self._model
+        if model is None:
+            model = self.model
+        try:
+            predictions = model.predict(text_for_detection, k=self.k)
+            set_field(row, self.to, self._result(predictions[0], predictions[1].tolist()))
+        except Exception:
+            # Fallback on error
+            set_field(row, self.to, _unknown_result())
+
+        return row
+
 
-        # Truncate if needed
-        if len(text_for_detection) > self.max_tokens:
-            text_for_detection = text_for_detection[: self.max_tokens]
+@components.add("tag", "language_batch")
+class LanguageBatchTagger(LanguageTagger, MapBatchesFn):
+    """Batched variant of LanguageTagger.
 
+    Collects a whole column of texts and runs a single FastText predict call
+    over the batch, so the Python-to-C++ boundary is crossed once per batch
+    instead of once per row. Results are written to a flat object column.
+    """
+
+    name: str = Field(default="language_tagger_batch", description="Name of the language tagger")
+    to: str = Field(default="language", description="Column to write language detection results to")
+
+    def __call__(self, batch: Batch) -> Batch:  # type: ignore[override]
+        """Add language detection for a whole batch of texts."""
+        texts = batch[self.on]
+        prepared = [self._prepare(text) for text in texts]
+        to_predict = [text for text in prepared if text is not None]
+
+        results: list[dict[str, list]] = []
         try:
-            predictions = self.model.predict(text_for_detection, k=self.k)
-
-            # Extract language codes and scores
-            languages: list = [pred.replace("__label__", "") for pred in predictions[0]]
-            scores: list = predictions[1].tolist()
-
-            # Filter by confidence lsh_threshold
-            if self.confidence_threshold > 0:
-                filtered_results = [
-                    (lang, score)
-                    for lang, score in zip(languages, scores, strict=False)
-                    if score >= self.confidence_threshold
-                ]
-                if filtered_results:
-                    languages, scores = zip(*filtered_results, strict=False)  # type: ignore[assignment]
-                    languages, scores = list(languages), list(scores)
+            if to_predict:
+                all_labels, all_scores = self.model.predict(to_predict, k=self.k)
+                predictions = iter(zip(all_labels, all_scores, strict=False))
+            else:
+                predictions = iter(())
+            for text in prepared:
+                if text is None:
+                    results.append(_unknown_result())
                 else:
-                    languages, scores = ["unknown"], [0.0]
-
-            set_field(
-                row,
-                self.to,
-                {
-                    "names": languages,
-                    "scores": scores,
-                },
-            )
+                    labels, scores = next(predictions)
+                    results.append(self._result(list(labels), list(scores)))
         except Exception:
             # Fallback on error
-            set_field(
-                row,
-                self.to,
-                {
-                    "names": ["unknown"],
-                    "scores": [0.0],
-                },
-            )
+            results = [_unknown_result() for _ in texts]
 
-        return row
+        batch[self.to] = np.fromiter(results, dtype=object, count=len(texts))
+        return batch
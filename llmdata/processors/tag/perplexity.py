@@ -1,15 +1,19 @@
+import functools
+import os
 import re
 import unicodedata
-import urllib.request
-from typing import Any, ClassVar, Literal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ClassVar, Literal
 
 import kenlm
+import numpy as np
+import regex
 import sentencepiece
 from pydantic import Field
 
-from llmdata.core.ops import MapFn, Row
+from llmdata.core.ops import Batch, MapBatchesFn, MapFn, Row
 from llmdata.core.registry import components
-from llmdata.core.utils import get_field, set_field
+from llmdata.core.utils import download_to_cache, get_field, set_field
 
 URLS = {
     "kenlm_model": "https://huggingface.co/ocisd4/kenlm/resolve/main/wikipedia/{language}.arpa.bin",
@@ -18,10 +22,10 @@ URLS = {
 }
 
 
-def download_to_tmp(url: str) -> str:
-    """Download the KenLM model files to temporary file."""
-    path, _ = urllib.request.urlretrieve(url)  # nosec B310
-    return path
+@functools.cache
+def _get_scoring_executor() -> ThreadPoolExecutor:
+    """Shared thread pool for GIL-releasing scoring work (KenLM, SentencePiece)."""
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
 
 
 class SentencePiece:
@@ -40,6 +44,10 @@ class SentencePiece:
         tokenized = self.sp.encode_as_pieces(text)
         return " ".join(tokenized)
 
+    def batch(self, texts: list[str]) -> list[str]:
+        """Tokenize several texts with a single C++ call."""
+        return [" ".join(pieces) for pieces in self.sp.encode(texts, out_type=str)]
+
 
 class KenlmModel:
     """Taken from https://huggingface.co/ocisd4/kenlm/blob/main/model.py for compatibility."""
@@ -81,8 +89,25 @@ class KenlmModel:
         "％": "%",  # noqa: RUF001
         "►": "-",
     }
+    # translate table equivalent of unicode_punct; str.translate handles the
+    # multi-character replacements ("…" -> "...") natively in one C-level scan
+    unicode_punct_table: ClassVar[dict[int, str]] = str.maketrans(unicode_punct)
     unicode_punct_re = re.compile(f"[{''.join(unicode_punct.keys())}]")
-    non_printing_chars_re = re.compile(f"[{''.join(map(chr, list(range(0,32)) + list(range(127,160))))}]")
+    _non_printing_chars: ClassVar[str] = "".join(map(chr, list(range(0, 32)) + list(range(127, 160))))
+    non_printing_chars_re = re.compile(f"[{_non_printing_chars}]")
+    # Fused normalization patterns: digits, unicode punctuation and
+    # non-printing chars are rewritten in one scan (see normalize) instead of
+    # one full-string substitution pass per category
+    _norm_punct_re = re.compile(f"\\d|[{''.join(unicode_punct.keys())}{_non_printing_chars}]")
+    _norm_plain_re = re.compile(f"\\d|[{_non_printing_chars}]")
+    _punct_removal: ClassVar[dict[str, str]] = dict.fromkeys(unicode_punct, "")
+    # ASCII fast path: no unicode punctuation can occur, so digit zeroing and
+    # non-printing removal collapse into one str.translate table each
+    _ascii_zero_digits: ClassVar[dict[int, Any]] = {
+        **dict.fromkeys([i for i in range(32)] + [127], None),
+        **{ord(d): "0" for d in "0123456789"},
+    }
+    _ascii_keep_digits: ClassVar[dict[int, Any]] = dict.fromkeys([i for i in range(32)] + [127], None)
     kenlm_model_dir = None
     sentence_piece_model_dir = None
 
@@ -94,12 +119,21 @@ class KenlmModel:
         normalize_numbers: bool = True,
         punctuation: int = 1,
     ):
-        self.model = kenlm.Model(download_to_tmp(URLS["kenlm_model"].format(language=language)))
-        self.tokenizer = SentencePiece(download_to_tmp(URLS["sp_model"].format(language=language)))
+        # Fetch both artifacts concurrently: the downloads are network-bound
+        # and release the GIL, so a cold start pays for the slowest file
+        # instead of the sum. Cache hits return immediately either way.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            kenlm_path, sp_path = executor.map(
+                download_to_cache,
+                [URLS["kenlm_model"].format(language=language), URLS["sp_model"].format(language=language)],
+            )
+        self.model = kenlm.Model(kenlm_path)
+        self.tokenizer = SentencePiece(sp_path)
         self.accent = remove_accents
         self.case = lower_case
         self.numbers = normalize_numbers
         self.punct = punctuation
+        self.normalize_fn = self._build_normalize_fn()
 
     @classmethod
     def from_pretrained(
@@ -118,27 +152,82 @@ class KenlmModel:
     def _pp(self, log_score: float, length: float) -> float:
         return float(10.0 ** (-log_score / length))
 
-    def get_perplexity(self, doc: str, normalize_cc_net: bool = True) -> float:
-        """Calculate perplexity score for a given text."""
-        if normalize_cc_net:
-            doc = self.normalize(
-                doc,
-                accent=self.accent,
-                case=self.case,
-                numbers=self.numbers,
-                punct=self.punct,
-            )
-        # Tokenize (after normalizing): See https://github.com/facebookresearch/cc_net/blob/bda555bd1cf1ee2e0b925363e62a61cd46c8b60d/cc_net/mine.py#L352 for full pipeline
-        doc = self.tokenizer(doc)
+    def _score_tokenized(self, doc: str) -> float:
+        """Score an already tokenized document."""
         doc_log_score: float = 0.0
         doc_length: float = 0.0
         for line in doc.split("\n"):
             log_score = self.model.score(line)
-            length = len(line.split()) + 1
+            # SentencePiece output is single-space separated with no empty
+            # pieces, so the token count is the space count + 1; counting
+            # avoids materializing a throwaway list per line just for len()
+            length = (line.count(" ") + 1 if line else 0) + 1
             doc_log_score += float(log_score)
             doc_length += float(length)
         return round(self._pp(doc_log_score, doc_length), 1)
 
+    def get_perplexity(self, doc: str, normalize_cc_net: bool = True) -> float:
+        """Calculate perplexity score for a given text."""
+        if normalize_cc_net:
+            doc = self.normalize_fn(doc)
+        # Tokenize (after normalizing): See https://github.com/facebookresearch/cc_net/blob/bda555bd1cf1ee2e0b925363e62a61cd46c8b60d/cc_net/mine.py#L352 for full pipeline
+        return self._score_tokenized(self.tokenizer(doc))
+
+    def get_perplexity_batch(self, docs: list[str], normalize_cc_net: bool = True) -> list[float]:
+        """Calculate perplexity scores for several texts.
+
+        Tokenizes the whole batch with one SentencePiece call (C++, no GIL)
+        and scores documents on the shared thread pool; documents that fail
+        to score get -1 instead of failing the batch.
+        """
+        if normalize_cc_net:
+            docs = [self.normalize_fn(doc) for doc in docs]
+        tokenized = self.tokenizer.batch(docs)
+
+        def score(doc: str) -> float:
+            try:
+                return self._score_tokenized(doc)
+            except Exception:
+                return -1
+
+        return list(_get_scoring_executor().map(score, tokenized))
+
+    def _build_normalize_fn(self) -> "Callable[[str], str]":
+        """Compose a normalize closure specialized for this instance's flags.
+
+        The flags are fixed at construction, so resolve the punct mode and
+        bind every table, pattern and method as a local once here; the
+        returned closure touches only fast locals per document.
+        """
+        cls = KenlmModel
+        case, accent, numbers = self.case, self.accent, self.numbers
+        strip_accents = self.strip_accents
+        ascii_table = cls._ascii_zero_digits if numbers else cls._ascii_keep_digits
+        punct_map = cls.unicode_punct if self.punct == 1 else (cls._punct_removal if self.punct == 2 else {})
+        pattern = cls._norm_punct_re if self.punct in (1, 2) else cls._norm_plain_re
+
+        def replace(match: re.Match) -> str:
+            c = match.group()
+            if numbers and c.isdigit():
+                return "0"
+            return punct_map.get(c, c if c.isdigit() else "")
+
+        sub = pattern.sub
+
+        def normalize_fn(line: str) -> str:
+            line = line.strip()
+            if not line:
+                return line
+            if case:
+                line = line.lower()
+            if accent:
+                line = strip_accents(line)
+            if line.isascii():
+                return line.translate(ascii_table)
+            return sub(replace, line)
+
+        return normalize_fn
+
     def normalize(
         self,
         line: str,
@@ -155,26 +244,46 @@ class KenlmModel:
             line = line.lower()
         if accent:
             line = self.strip_accents(line)
-        if numbers:
-            line = self.digit_re.sub("0", line)
-        if punct == 1:
-            line = self.replace_unicode_punct(line)
-        elif punct == 2:
-            line = self.remove_unicode_punct(line)
-        line = self.remove_non_printing_char(line)
-        return line
+
+        # Fuse the digit, punctuation and non-printing rewrites into a single
+        # scan, so large documents are copied once instead of once per pass.
+        # The tables and patterns live on the class; bind them through it
+        # directly so the per-call lookups skip the instance dict
+        cls = KenlmModel
+        if line.isascii():
+            # ASCII text cannot contain the unicode punctuation or C1 range,
+            # so the whole rewrite is a single C-level translate
+            return line.translate(cls._ascii_zero_digits if numbers else cls._ascii_keep_digits)
+
+        punct_map = cls.unicode_punct if punct == 1 else (cls._punct_removal if punct == 2 else {})
+        pattern = cls._norm_punct_re if punct in (1, 2) else cls._norm_plain_re
+
+        def replace(match: re.Match) -> str:
+            c = match.group()
+            if numbers and c.isdigit():
+                return "0"
+            # Unmapped non-digits are punctuation to remove (punct == 2) or
+            # non-printing chars; digits pass through when numbers is off
+            return punct_map.get(c, c if c.isdigit() else "")
+
+        return pattern.sub(replace, line)
+
+    # Combining marks (category Mn) removed after NFD decomposition; the regex
+    # module scans in C instead of calling unicodedata.category per codepoint
+    _mn_re: ClassVar[regex.Pattern] = regex.compile(r"\p{Mn}+")
 
     def strip_accents(self, line: str) -> str:
         """Strip accents from a piece of text."""
         nfd = unicodedata.normalize("NFD", line)
-        output = [c for c in nfd if unicodedata.category(c) != "Mn"]
-        if len(output) == line:
+        output = self._mn_re.sub("", nfd)
+        if len(output) == len(nfd):
+            # Nothing was stripped; keep the original (composed) string
             return line
-        return "".join(output)
+        return output
 
     def replace_unicode_punct(self, text: str) -> str:
         """Replace unicode punctuation with accents."""
-        return "".join(self.unicode_punct.get(c, c) for c in text)
+        return text.translate(self.unicode_punct_table)
 
     def remove_unicode_punct(self, text: str) -> str:
         """More aggressive version of replace_unicode_punct but also faster."""
@@ -185,10 +294,29 @@ class KenlmModel:
         return self.non_printing_chars_re.sub("", text)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_kenlm(language: Literal["en", "de"]) -> KenlmModel:
+    """Load a KenLM model once per process, shared across tagger instances.
+
+    kenlm.Model mmaps the binary, so loading in the parent before fork() also
+    lets workers share the mapped pages read-only instead of multiplying RSS
+    by the worker count (spawn-based pools still avoid cold starts via
+    prewarm, but do not share pages).
+    """
+    return KenlmModel.from_pretrained(language)
+
+
 @components.add("tag", "perplexity")
 class PerplexityTagger(MapFn):
     """Tagger that applies a KenLM model to text to calculate perplexity."""
 
+    # C0 controls (except \t, \n) and DEL are single bytes in UTF-8, so they
+    # are deleted with bytes.translate at memcpy speed; C1 controls are
+    # multi-byte (0xC2 lead) and handled in a separate str pass only when the
+    # lead byte is present at all
+    _CTRL_DELETE: ClassVar[bytes] = bytes([i for i in range(32) if i not in (9, 10)] + [127])
+    _C1_TABLE: ClassVar[dict[int, None]] = dict.fromkeys(range(128, 160), None)
+
     # Override base fields with specific defaults
     name: str = Field(default="ocr_quality", description="Name of the perplexity tagger")
     on: str = Field(default="text", description="Column containing text to analyze")
@@ -204,21 +332,64 @@ class PerplexityTagger(MapFn):
     def model(self):  # type: ignore
         """The underlying KenLM detection model."""
         if self._model is None:
-            self._model = KenlmModel.from_pretrained(self.language)
+            self._model = _load_kenlm(self.language)
         return self._model
 
-    def __call__(self, row: Row) -> Row:
-        """Add perplexity to metadata."""
-        text = get_field(row, self.on) or ""
-        text = text.encode("utf-8", "ignore").decode("utf-8", "replace")
+    def prewarm(self) -> None:
+        """Load the model in the current process.
+
+        Intended as a pool initializer (fork-after-load) so workers inherit
+        the mmap'd KenLM binary instead of each loading their own copy.
+        """
+        self.model  # noqa: B018
+
+    def _sanitize(self, text: str | None) -> str:
+        """Strip control characters and truncate a text for scoring."""
+        text = text or ""
         # Remove control characters except common whitespace
-        text = "".join(c for c in text if ord(c) >= 32 or c in "\t\n")
+        text_bytes = text.encode("utf-8", "replace").translate(None, delete=self._CTRL_DELETE)
+        text = text_bytes.decode("utf-8", "replace")
+        if b"\xc2" in text_bytes:  # Only texts containing U+0080..U+00BF pay the C1 pass
+            text = text.translate(self._C1_TABLE)
+        if len(text) > self.max_chars:
+            text = text[: self.max_chars]
+        return text
+
+    def _score(self, text: str | None) -> float:
+        """Sanitize a single text and return its perplexity (-1 on error)."""
+        # Read the cached model directly; the property (None check + call)
+        # only has to run until the first row has triggered the load
+        model = self._model
+        if model is None:
+            model = self.model
         try:
-            if len(text) > self.max_chars:
-                score = self.model.get_perplexity(text[: self.max_chars])
-            else:
-                score = self.model.get_perplexity(text)
+            return model.get_perplexity(self._sanitize(text))
         except Exception:
-            score = -1
-        set_field(row, self.to, score)
+            return -1
+
+    def __call__(self, row: Row) -> Row:
+        """Add perplexity to metadata."""
+        set_field(row, self.to, self._score(get_field(row, self.on)))
         return row
+
+
+@components.add("tag", "perplexity_batch")
+class PerplexityBatchTagger(PerplexityTagger, MapBatchesFn):
+    """Batched variant of PerplexityTagger.
+
+    Tokenizes the whole batch with one SentencePiece call, then scores rows
+    on the shared thread pool (kenlm.Model.score releases the GIL), instead
+    of walking the batch serially one Python round-trip at a time.
+    """
+
+    name: str = Field(default="perplexity_batch", description="Name of the perplexity tagger")
+
+    def __call__(self, batch: Batch) -> Batch:  # type: ignore[override]
+        """Add perplexity scores for a whole batch of texts."""
+        texts = [self._sanitize(text) for text in batch[self.on]]
+        try:
+            scores = self.model.get_perplexity_batch(texts)
+        except Exception:
+            scores = [-1.0] * len(texts)
+        batch[self.to] = np.asarray(scores)
+        return batch
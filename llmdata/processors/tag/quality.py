@@ -1,7 +1,7 @@
 import re
 import string
 from collections import Counter
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 import numpy as np
 from ocroscope import ocr_evaluation
@@ -11,6 +11,32 @@ from llmdata.core.ops import MapFn, Row
 from llmdata.core.registry import components
 from llmdata.core.utils import get_field, set_field
 
+# Both ellipsis forms ("..." and UTF-8 "\xe2\x80\xa6" for U+2026) in one
+# alternation, so a single scan over the encoded text counts them together
+_ELLIPSIS_BYTES_RE = re.compile(rb"\.\.\.|\xe2\x80\xa6")
+
+# Roman-numeral page markers, either case (the original pattern was
+# case-insensitive)
+_ROMAN_NUMERAL_CHARS = frozenset("IVXivx")
+
+# Legitimate 2-letter words; anything else of length <= 2 counts as a
+# likely OCR fragment
+_SHORT_WORD_WHITELIST = frozenset(
+    {
+        # English 2-letter words
+        *("am", "an", "as", "at", "be", "by", "do", "go", "he", "if", "in", "is"),
+        *("it", "me", "my", "no", "of", "on", "or", "so", "to", "up", "us", "we"),
+        # German 2-letter words
+        *("ab", "ad", "au", "da", "du", "eh", "ei", "er", "es", "ex"),
+        *("im", "ja", "je", "la", "ob", "oh", "um", "wo", "zu"),
+    }
+)
+
+# Lines opening with a bullet or closing with an ellipsis, found in one
+# multiline scan over the text instead of lstrip/rstrip per line
+_BULLET_LINE_RE = re.compile(r"^\s*[•\-]", re.MULTILINE)
+_ELLIPSIS_LINE_RE = re.compile(r"(?:\.\.\.|…)\s*$", re.MULTILINE)
+
 
 @components.add("tag", "gopher_quality")
 class GopherQualityTagger(MapFn):
@@ -141,7 +167,8 @@ class GopherQualityTagger(MapFn):
                 "mal",  # particles and discourse markers
             },
         }[self.language]
-        self._punctuation_set = set(string.punctuation)
+        self._stop_words = frozenset(self._stop_words)
+        self._punctuation_set = frozenset(string.punctuation)
 
     def __call__(self, row: Row) -> Row:
         """Calculate gopher quality metrics."""
@@ -165,30 +192,48 @@ class GopherQualityTagger(MapFn):
             )
             return row
 
-        words = " ".join(text.split(" ")).split(" ")  # Collapse multiple whitespace and split into words
+        words = text.split()  # Collapses any whitespace run in a single C-level pass
         n_words = len(words)
-        non_symbol_words = [w for w in words if any(ch not in self._punctuation_set for ch in w)]
-        n_non_symbol_words = len(non_symbol_words)
         lines = text.splitlines()
         n_lines = len(lines)
+        # Count hashes and ellipses on the UTF-8 bytes: one memchr-style pass
+        # for '#' and one regex pass covering both ellipsis spellings, instead
+        # of three separate scans over the str object
+        encoded = text.encode("utf-8")
+
+        # Single pass over words: stop-word hits, alpha detection and
+        # non-symbol-word stats all share one traversal, and only the
+        # handful of distinct stop words found is ever allocated (rather
+        # than an O(n_words) set of the whole document)
+        stop_words = self._stop_words
+        punctuation = self._punctuation_set
+        stop_words_seen: set = set()
+        alpha_words = 0
+        non_symbol_lengths = []
+        for w in words:
+            if w in stop_words:
+                stop_words_seen.add(w)
+            if any(c.isalpha() for c in w):
+                alpha_words += 1
+            if any(ch not in punctuation for ch in w):
+                non_symbol_lengths.append(len(w))
+
+        n_non_symbol_words = len(non_symbol_lengths)
+        avg_word_length = (
+            float(np.fromiter(non_symbol_lengths, dtype=np.int32, count=n_non_symbol_words).mean())
+            if non_symbol_lengths
+            else 0.0
+        )
 
         stats = {
             "word_count": n_non_symbol_words,
-            "avg_word_length": float(np.mean([len(w) for w in non_symbol_words]) if non_symbol_words else 0.0),
-            "hash_ratio": text.count("#") / max(n_words, 1),
-            "ellipsis_ratio": (text.count("...") + text.count("…")) / max(n_words, 1),
-            "bullet_line_ratio": (
-                sum(s.lstrip().startswith("•") or s.lstrip().startswith("-") for s in lines) / n_lines
-                if n_lines > 0
-                else 0.0
-            ),
-            "ellipsis_line_ratio": (
-                sum(s.rstrip().endswith("...") or s.rstrip().endswith("…") for s in lines) / n_lines
-                if n_lines > 0
-                else 0.0
-            ),
-            "stop_word_count": len(self._stop_words.intersection(set(words))),
-            "alpha_word_ratio": (sum(any(c.isalpha() for c in w) for w in words) / n_words if n_words > 0 else 0.0),
+            "avg_word_length": avg_word_length,
+            "hash_ratio": encoded.count(b"#") / max(n_words, 1),
+            "ellipsis_ratio": len(_ELLIPSIS_BYTES_RE.findall(encoded)) / max(n_words, 1),
+            "bullet_line_ratio": (len(_BULLET_LINE_RE.findall(text)) / n_lines if n_lines > 0 else 0.0),
+            "ellipsis_line_ratio": (len(_ELLIPSIS_LINE_RE.findall(text)) / n_lines if n_lines > 0 else 0.0),
+            "stop_word_count": len(stop_words_seen),
+            "alpha_word_ratio": alpha_words / n_words if n_words > 0 else 0.0,
         }
         set_field(row, self.to, stats)
         return row
@@ -219,12 +264,23 @@ class GopherRepetitionTagger(MapFn):
         self._line_splitter = re.compile("\n+")
 
     @staticmethod
-    def _get_n_grams(words: list[str], n: int) -> list[str]:
-        return [" ".join(words[i : i + n]) for i in range(len(words) - n + 1)]
+    def _find_top_duplicate(words: list[str], n: int) -> int:
+        """Character length covered by the most common n-gram, spaces included.
+
+        Counts window tuples directly (tuple hashing reuses the word strings)
+        instead of joining every window into a throwaway string; only the
+        winner's length is ever computed.
+        """
+        if len(words) < n:
+            return 0
+        counter = Counter(zip(*(words[i:] for i in range(n))))
+        window, count = counter.most_common(1)[0]
+        return (sum(map(len, window)) + n - 1) * count
 
     @staticmethod
     def _find_duplicates(x: list[str]) -> tuple[int, int]:
-        unique_x = set()
+        unique_x: set = set()
+        add = unique_x.add  # bound once; the loop below is pure membership work
         duplicate_chars = 0
         duplicate_elements = 0
         for element in x:
@@ -232,32 +288,85 @@ class GopherRepetitionTagger(MapFn):
                 duplicate_chars += len(element)
                 duplicate_elements += 1
             else:
-                unique_x.add(element)
+                add(element)
         return duplicate_elements, duplicate_chars
 
+    # Rabin-Karp rolling hash parameters: 64-bit arithmetic with the same
+    # multiplier CPython uses for tuple hashing
+    _HASH_MASK: ClassVar[int] = (1 << 64) - 1
+    _HASH_BASE: ClassVar[int] = 1000003
+
     @staticmethod
-    def _find_top_duplicate(x: list[str]) -> int:
-        if not x:
-            return 0
-        counter: Counter = Counter()
-        for element in x:
-            counter[element] += 1
-        top_n_gram = counter.most_common(1)[0]
-        return len(top_n_gram[0]) * top_n_gram[1]
+    def _repeat_candidates(word_hashes: list[int], n: int) -> list[bool]:
+        """Mark start positions whose n-gram occurs more than once.
+
+        A window whose leading min-n-gram is globally unique cannot start a
+        duplicate for any larger n either (an equal window elsewhere would
+        imply an equal prefix), so one counting pass here lets every
+        per-n scan skip the set bookkeeping for unrepeatable positions.
+        """
+        last = len(word_hashes) - n
+        if last < 0:
+            return []
+
+        mask = GopherRepetitionTagger._HASH_MASK
+        base = GopherRepetitionTagger._HASH_BASE
+        base_pow = pow(base, n - 1, 1 << 64)
+
+        hashes = [0] * (last + 1)
+        h = 0
+        for j in range(n):
+            h = (h * base + word_hashes[j]) & mask
+        hashes[0] = h
+        for i in range(1, last + 1):
+            h = ((h - word_hashes[i - 1] * base_pow) * base + word_hashes[i + n - 1]) & mask
+            hashes[i] = h
+        counts = Counter(hashes)
+        return [counts[h] > 1 for h in hashes]
 
     @staticmethod
-    def _find_all_duplicate(words: list[str], n: int) -> int:
-        n_words = len(words)
+    def _find_all_duplicate(
+        word_hashes: list[int], length_prefix: list[int], n: int, candidates: list[bool] | None = None
+    ) -> int:
+        """Count characters covered by repeated n-grams via a rolling hash.
+
+        Instead of joining each window into a fresh string (O(window chars)
+        per position), the window hash is rolled in O(1) per step over the
+        precomputed per-word hashes, and character counts come from the
+        prefix-sum of word lengths. Positions ruled out by `candidates`
+        (see _repeat_candidates) bypass the membership set entirely.
+        """
+        last = len(word_hashes) - n
+        if last < 0:
+            return 0
+
+        mask = GopherRepetitionTagger._HASH_MASK
+        base = GopherRepetitionTagger._HASH_BASE
+        base_pow = pow(base, n - 1, 1 << 64)
+
+        def window_hash(i: int) -> int:
+            h = 0
+            for j in range(i, i + n):
+                h = (h * base + word_hashes[j]) & mask
+            return h
+
         unique = set()
         repeated_chars, idx = 0, 0
-        while idx < n_words - n + 1:
-            n_gram = "".join(words[idx : idx + n])
-            if n_gram in unique:
-                repeated_chars += len(n_gram)
-                idx += n
-            else:
-                unique.add(n_gram)
-                idx += 1
+        h = window_hash(0)
+        while True:
+            if candidates is None or candidates[idx]:
+                if h in unique:
+                    repeated_chars += length_prefix[idx + n] - length_prefix[idx]
+                    idx += n
+                    if idx > last:
+                        break
+                    h = window_hash(idx)
+                    continue
+                unique.add(h)
+            idx += 1
+            if idx > last:
+                break
+            h = ((h - word_hashes[idx - 1] * base_pow) * base + word_hashes[idx + n - 1]) & mask
         return repeated_chars
 
     def __call__(self, row: Row) -> Row:
@@ -313,21 +422,23 @@ class GopherRepetitionTagger(MapFn):
         repetition_data["dup_line_frac"] = dup_line_frac
         repetition_data["dup_line_char_frac"] = dup_line_char_frac
 
-        words = " ".join(text.split(" ")).split(" ")  # collapse whitespace and separate into words
+        words = text.split()  # collapses any whitespace run in a single C-level pass
 
         # Top n-gram analysis
         for n in self.top_n_grams:
-            n_grams = self._get_n_grams(words, n)
-            if n_grams:
-                top_char_length = self._find_top_duplicate(n_grams)
-                top_char_frac = top_char_length / max(text_len, 1)
-            else:
-                top_char_frac = 0.0
-            repetition_data[f"top_{n}_gram_char_frac"] = top_char_frac
-
-        # Duplicate n-gram analysis
+            top_char_length = self._find_top_duplicate(words, n)
+            repetition_data[f"top_{n}_gram_char_frac"] = top_char_length / max(text_len, 1)
+
+        # Duplicate n-gram analysis: hash every word and prefix-sum the word
+        # lengths once, shared by all n values
+        mask = self._HASH_MASK
+        word_hashes = [hash(w) & mask for w in words]
+        length_prefix = [0] * (len(words) + 1)
+        for i, w in enumerate(words):
+            length_prefix[i + 1] = length_prefix[i] + len(w)
+        candidates = self._repeat_candidates(word_hashes, min(self.dup_n_grams)) if self.dup_n_grams else []
         for n in self.dup_n_grams:
-            n_duplicates_char = self._find_all_duplicate(words, n)
+            n_duplicates_char = self._find_all_duplicate(word_hashes, length_prefix, n, candidates)
             dup_char_frac = n_duplicates_char / max(text_len, 1)
             repetition_data[f"dup_{n}_gram_char_frac"] = dup_char_frac
 
@@ -367,212 +478,178 @@ class OCRQualityTagger(MapFn):
         }
         self._case_patterns = {k: re.compile(v) for k, v in self._case_patterns.items()}  # type: ignore[misc]
 
-        # Repeated character patterns
-        self._repeat_patterns = {
-            "repeated_chars": r"(.)\1{3,}",
-            "repeated_sequences": r"(.{2,5})\1{2,}",
-        }
-        self._repeat_patterns = {k: re.compile(v) for k, v in self._repeat_patterns.items()}  # type: ignore[misc]
-
-    def _calculate_spacing_anomaly_ratio(self, text: str) -> float:
-        """Calculate ratio of spacing anomalies."""
-        if not text:
-            return 0.0
-
-        words = text.split()
-        if not words:
-            return 0.0
-
-        anomalies = 0
-        anomalies += len(self._spacing_patterns["missing_spaces"].findall(text))  # type: ignore[attr-defined]
-        anomalies += len(self._spacing_patterns["excessive_spaces"].findall(text))  # type: ignore[attr-defined]
-        anomalies += len(self._spacing_patterns["spaced_words"].findall(text))  # type: ignore[attr-defined]
-        anomalies += len(self._spacing_patterns["very_long_words"].findall(text))  # type: ignore[attr-defined]
-        return min(anomalies / max(len(words), 1), 1.0)
-
-    def _calculate_case_anomaly_ratio(self, text: str) -> float:
-        """Calculate ratio of case anomalies."""
-        if not text:
-            return 0.0
-
-        words = [w for w in text.split() if w.isalpha()]
-        if not words:
-            return 0.0
-
-        anomalies = 0
-        anomalies += len(self._case_patterns["random_caps"].findall(text))  # type: ignore[attr-defined]
-        anomalies += len(self._case_patterns["mixed_case_words"].findall(text))  # type: ignore[attr-defined]
-        return min(anomalies / max(len(words), 1), 1.0)
-
-    def _calculate_word_fragment_ratio(self, text: str) -> float:
-        """Calculate ratio of likely word fragments."""
-        if not text:
-            return 0.0
-
-        words = text.split()
-        if not words:
-            return 0.0
-
-        # Count very short words that are likely fragments
-        fragments = 0
-        for word in words:
-            clean_word = re.sub(r"[^\w]", "", word)
-            if (
-                len(clean_word) == 1
-                and clean_word.isalpha()
-                or len(clean_word) == 2
-                and clean_word.isalpha()
-                and clean_word.lower()
-                not in {
-                    # English 2-letter words
-                    "am",
-                    "an",
-                    "as",
-                    "at",
-                    "be",
-                    "by",
-                    "do",
-                    "go",
-                    "he",
-                    "if",
-                    "in",
-                    "is",
-                    "it",
-                    "me",
-                    "my",
-                    "no",
-                    "of",
-                    "on",
-                    "or",
-                    "so",
-                    "to",
-                    "up",
-                    "us",
-                    "we",
-                    # German 2-letter words
-                    "ab",
-                    "ad",
-                    "au",
-                    "da",
-                    "du",
-                    "eh",
-                    "ei",
-                    "er",
-                    "es",
-                    "ex",
-                    "im",
-                    "ja",
-                    "je",
-                    "la",
-                    "ob",
-                    "oh",
-                    "um",
-                    "wo",
-                    "zu",
-                }
-            ):
-                fragments += 1
-
-        return min(fragments / max(len(words), 1), 1.0)
-
-    def _calculate_line_artifact_ratio(self, text: str) -> float:
-        """Calculate ratio of lines that are likely artifacts."""
-        if not text:
-            return 0.0
-
+        # Repeated sequences; single-character runs are detected over the
+        # codepoint array instead (see _repeated_run_chars)
+        self._repeated_seq_re = re.compile(r"(.{2,5})\1{2,}")
+
+        # Patterns applied per word/line; precompiled here so the hot loops
+        # skip the re module cache lookup on every call
+        self._nonword_re = re.compile(r"[^\w]")
+        # Digit-only and roman-numeral lines are cheaper to test with str
+        # methods; only these two shapes still need the regex engine
+        self._page_line_re = re.compile(r"Page\s+\d+", re.IGNORECASE)
+        self._symbol_line_re = re.compile(r"[^\w\s]+")
+        self._numeric_ctx_re = re.compile(r"[a-zA-Z]\d|\d[a-zA-Z]")
+        self._embedded_num_re = re.compile(r"\d[a-zA-Z][a-zA-Z]*\d")
+        self._ordinal_re = re.compile(r"^\d+(st|nd|rd|th)$", re.IGNORECASE)
+
+        # Characters that often result from broken OCR; the two large Unicode
+        # blocks (General Punctuation, Dingbats) are checked as vectorized
+        # range masks, so only the explicit singletons need a lookup array
+        unusual_chars = "«»" "''‚„‹›¡¿¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿" "†‡•…‰‹›€™"  # noqa: RUF001
+        self._unusual_singleton_cp = np.unique(np.fromiter(map(ord, unusual_chars), dtype=np.uint32))
+
+    def _analyze(self, text: str) -> dict[str, float]:
+        """Compute all OCR quality metrics over shared token lists.
+
+        `words`, their cleaned forms and `lines` are built once and every
+        per-word counter runs inside a single loop, so the text is no longer
+        re-split and re-cleaned by each metric. Only the patterns that span
+        word boundaries (spacing, case, repeats) still scan the full text.
+        """
         lines = text.splitlines()
-        if not lines:
-            return 0.0
-
+        # One codepoint array shared by every character-level scan
+        codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+        sub = self._nonword_re.sub
+        has_mixed = self._numeric_ctx_re.search
+        has_embedded = self._embedded_num_re.search
+        is_ordinal = self._ordinal_re.match
+        is_page_line = self._page_line_re.match
+        is_symbol_line = self._symbol_line_re.fullmatch
+
+        # Words are consumed per line inside the line loop, so the document-
+        # sized word list is never materialized; only running counters and
+        # the cleaned-length list survive the scan
+        n_words = 0
+        fragments = 0
+        numeric_errors = 0
+        n_alpha_words = 0
         artifacts = 0
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Single characters or very short lines
-            if (
+        word_lengths = []
+        for raw_line in lines:
+            line = raw_line.strip()
+            # Single characters or very short lines, bare numbers, roman
+            # numerals, page markers and symbol-only separator lines
+            if line and (
                 len(line) <= 2
-                or re.match(r"^[^\w\s]+$", line)
-                or re.match(r"^\d+$", line)
-                or re.match(r"^\d+\s*$|^[IVX]+\s*$|^Page\s+\d+", line, re.IGNORECASE)
+                or line.isdigit()
+                or all(c in _ROMAN_NUMERAL_CHARS for c in line)
+                or is_page_line(line)
+                or is_symbol_line(line)
             ):
                 artifacts += 1
 
-        return min(artifacts / max(len(lines), 1), 1.0)
+            for word in raw_line.split():
+                n_words += 1
+                if word.isalpha():
+                    n_alpha_words += 1
+
+                # Numbers embedded in words (excluding common patterns like "2nd", "1st")
+                if has_mixed(word) and not is_ordinal(word) or has_embedded(word):
+                    numeric_errors += 1
+
+                clean_word = sub("", word)
+                if clean_word:
+                    word_lengths.append(len(clean_word))
+
+                # Very short words that are likely fragments
+                if (
+                    len(clean_word) == 1
+                    and clean_word.isalpha()
+                    or len(clean_word) == 2
+                    and clean_word.isalpha()
+                    and clean_word.lower() not in _SHORT_WORD_WHITELIST
+                ):
+                    fragments += 1
+
+        spacing_anomalies = sum(
+            len(pattern.findall(text))
+            for pattern in self._spacing_patterns.values()  # type: ignore[attr-defined]
+        )
+        case_anomalies = sum(
+            len(pattern.findall(text))
+            for pattern in self._case_patterns.values()  # type: ignore[attr-defined]
+        )
+
+        if word_lengths:
+            lengths = np.fromiter(word_lengths, dtype=np.int32, count=len(word_lengths))
+            avg_length = float(lengths.mean())
+            std_length = float(lengths.std()) if lengths.size > 1 else 0.0
+            very_short = float((lengths <= 1).mean())
+            very_long = float((lengths >= 15).mean())
+        else:
+            avg_length = std_length = very_short = very_long = 0.0
+
+        return {
+            "spacing_anomaly_ratio": min(spacing_anomalies / max(n_words, 1), 1.0) if n_words else 0.0,
+            "case_anomaly_ratio": min(case_anomalies / n_alpha_words, 1.0) if n_alpha_words else 0.0,
+            "word_fragment_ratio": min(fragments / max(n_words, 1), 1.0) if n_words else 0.0,
+            "line_artifact_ratio": min(artifacts / max(len(lines), 1), 1.0) if lines else 0.0,
+            "special_char_density": self._calculate_special_char_density(codepoints),
+            "repeated_char_ratio": self._calculate_repeated_char_ratio(text, codepoints),
+            "numeric_context_errors": min(numeric_errors / max(n_words, 1), 1.0),
+            "word_length_avg": avg_length,
+            "word_length_std": std_length,
+            "ratio_very_short_words": very_short,
+            "ratio_very_long_words": very_long,
+        }
 
-    def _calculate_special_char_density(self, text: str) -> float:
+    def _calculate_special_char_density(self, codepoints: np.ndarray) -> float:
         """Calculate density of unusual special characters."""
-        if not text:
+        if codepoints.size == 0:
             return 0.0
 
-        # Count unusual characters that often result from OCR errors
-        unusual_chars = 0
-        for char in text:
-            # Various unicode ranges that often appear in broken OCR
-            if (
-                char in "«»" "''‚„‹›¡¿¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿"  # noqa: RUF001
-                or char in "†‡•…‰‹›€™"  # Special punctuation # noqa: RUF001
-                or 0x2000 <= ord(char) <= 0x206F  # General punctuation block
-                or 0x2700 <= ord(char) <= 0x27BF  # Dingbats block
-            ):
-                unusual_chars += 1
+        # The singleton array is sorted and deduplicated at construction, so
+        # membership is a binary search per codepoint instead of np.isin's
+        # per-call sort of the haystack
+        singletons = self._unusual_singleton_cp
+        pos = np.searchsorted(singletons, codepoints)
+        np.minimum(pos, singletons.size - 1, out=pos)
+        mask = (
+            (singletons[pos] == codepoints)
+            | ((codepoints >= 0x2000) & (codepoints <= 0x206F))  # General punctuation block
+            | ((codepoints >= 0x2700) & (codepoints <= 0x27BF))  # Dingbats block
+        )
+        return min(int(mask.sum()) / codepoints.size, 1.0)
+
+    @staticmethod
+    def _repeated_run_chars(codepoints: np.ndarray) -> int:
+        """Total characters inside runs of one repeated character (length 4+).
+
+        Vectorized replacement for the backtracking r"(.)\\1{3,}" scan: equal
+        adjacent codepoints are found with one comparison, run boundaries by
+        differencing the mask. Newline runs are excluded, matching '.'.
+        """
+        if codepoints.size < 4:
+            return 0
+
+        eq = codepoints[1:] == codepoints[:-1]
+        boundaries = np.diff(eq.astype(np.int8))
+        starts = np.flatnonzero(boundaries == 1) + 1
+        ends = np.flatnonzero(boundaries == -1) + 1
+        if eq[0]:
+            starts = np.concatenate(([0], starts))
+        if eq[-1]:
+            ends = np.concatenate((ends, [eq.size]))
 
-        return min(unusual_chars / max(len(text), 1), 1.0)
+        run_lengths = ends - starts + 1  # comparisons -> characters
+        keep = (run_lengths >= 4) & (codepoints[starts] != 0x0A)
+        return int(run_lengths[keep].sum())
 
-    def _calculate_repeated_char_ratio(self, text: str) -> float:
+    def _calculate_repeated_char_ratio(self, text: str, codepoints: np.ndarray) -> float:
         """Calculate ratio of repeated character sequences."""
         if not text:
             return 0.0
 
-        repeated_chars = 0
-
-        # Find sequences of repeated characters (3+ repetitions)
-        for match in self._repeat_patterns["repeated_chars"].finditer(text):  # type: ignore[attr-defined]
-            repeated_chars += len(match.group(0))
-
-        # Find repeated sequences
-        for match in self._repeat_patterns["repeated_sequences"].finditer(text):  # type: ignore[attr-defined]
+        # Single-character runs come from the vectorized scan; only the
+        # multi-character sequence pattern still needs the regex engine
+        repeated_chars = self._repeated_run_chars(codepoints)
+        for match in self._repeated_seq_re.finditer(text):
             repeated_chars += len(match.group(0))
 
         return min(repeated_chars / max(len(text), 1), 1.0)
 
-    def _calculate_numeric_context_errors(self, text: str) -> float:
-        """Calculate ratio of numbers appearing in inappropriate word contexts."""
-        words = text.split()
-        errors = 0
-        for word in words:
-            # Numbers embedded in words (excluding common patterns like "2nd", "1st")
-            if (
-                re.search(r"[a-zA-Z]\d|d[a-zA-Z]", word)
-                and not re.match(r"^\d+(st|nd|rd|th)$", word, re.IGNORECASE)
-                or re.search(r"\d[a-zA-Z][a-zA-Z]*\d", word)
-            ):
-                errors += 1
-
-        return min(errors / max(len(words), 1), 1.0)
-
-    def _calculate_length_distribution(self, text: str) -> tuple[float, float]:
-        """Calculate word length distribution (mean/std)."""
-        words = [re.sub(r"[^\w]", "", word) for word in text.split() if re.sub(r"[^\w]", "", word)]
-        word_lengths = [len(word) for word in words]
-        avg_length = np.mean(word_lengths)
-        std_length = np.std(word_lengths) if len(word_lengths) > 1 else 0.0
-
-        return float(avg_length), float(std_length)
-
-    def _calculate_length_extremes(self, text: str) -> tuple[float, float]:
-        """Calculate ratio of very short and very long words."""
-        words = [re.sub(r"[^\w]", "", word) for word in text.split() if re.sub(r"[^\w]", "", word)]
-        if not words:
-            return 0.0, 0.0
-
-        word_lengths = [len(word) for word in words]
-        very_short = sum(1 for length in word_lengths if length <= 1) / max(len(words), 1)
-        very_long = sum(1 for length in word_lengths if length >= 15) / max(len(words), 1)
-
-        return very_short, very_long
-
     def __call__(self, row: Row) -> Row:
         """Calculate OCR quality metrics."""
         text = get_field(row, self.on)
@@ -595,24 +672,7 @@ class OCRQualityTagger(MapFn):
             set_field(row, self.to, ocr_stats)
             return row
 
-        avg_length, std_length = self._calculate_length_distribution(text)
-        ratio_short, ratio_long = self._calculate_length_extremes(text)
-
-        ocr_stats = {
-            "spacing_anomaly_ratio": self._calculate_spacing_anomaly_ratio(text) or 0.0,
-            "case_anomaly_ratio": self._calculate_case_anomaly_ratio(text) or 0.0,
-            "word_fragment_ratio": self._calculate_word_fragment_ratio(text) or 0.0,
-            "line_artifact_ratio": self._calculate_line_artifact_ratio(text) or 0.0,
-            "special_char_density": self._calculate_special_char_density(text) or 0.0,
-            "repeated_char_ratio": self._calculate_repeated_char_ratio(text) or 0.0,
-            "numeric_context_errors": self._calculate_numeric_context_errors(text) or 0.0,
-            "word_length_avg": avg_length or 0.0,
-            "word_length_std": std_length or 0.0,
-            "ratio_very_short_words": ratio_short or 0.0,
-            "ratio_very_long_words": ratio_long or 0.0,
-        }
-
-        set_field(row, self.to, ocr_stats)
+        set_field(row, self.to, self._analyze(text))
         return row
 
 
@@ -626,18 +686,24 @@ class OCRoscopeTagger(MapFn):
     to: str = Field(default="ocr_quality", description="Column to write OCR quality metrics to")
     max_chars: int = Field(default=2**16, description="Maximum number of characters to use for perplexity estimation")
 
+    # C0 control bytes except \t and \n; single bytes in UTF-8, so deleting
+    # them at the byte level cannot split a multi-byte sequence
+    _CTRL_DELETE: ClassVar[bytes] = bytes(i for i in range(32) if i not in (9, 10))
+
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
 
     def __call__(self, row: Row) -> Row:
         """Calculate OCR quality metrics."""
-        text = get_field(row, self.on) or ""
-        text = text.encode("utf-8", "ignore").decode("utf-8", "replace")
-        # Remove control characters except common whitespace
-        text = "".join(c for c in text if ord(c) >= 32 or c in "\t\n")
+        # Truncate before sanitizing so the passes below cost O(max_chars)
+        # rather than O(document) on multi-MB OCR dumps
+        text = (get_field(row, self.on) or "")[: self.max_chars]
+        # Remove control characters except common whitespace during the same
+        # encode/decode round-trip that scrubs unencodable code points,
+        # instead of a per-character Python loop over the whole text
+        text_bytes = text.encode("utf-8", "ignore").translate(None, delete=self._CTRL_DELETE)
+        text = text_bytes.decode("utf-8", "replace")
         try:
-            if len(text) > self.max_chars:
-                text = text[: self.max_chars]
             ocr_estimate = ocr_evaluation(id=None, text=text)
             ocr_estimate.calculate_ocr_rate()
             score = ocr_estimate.ratio_segment
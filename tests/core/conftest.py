@@ -0,0 +1,25 @@
+"""Shared fixtures for the core test modules."""
+
+import pytest
+
+from llmdata.core.config import get_default_ray_config
+
+
+def pytest_configure(config):
+    """Register marks used by the core tests."""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): serialize tests in the same group under pytest-xdist --dist=loadgroup",
+    )
+
+
+@pytest.fixture(scope="session")
+def default_ray_config():
+    """Default Ray config, built once and shared across the whole session."""
+    return get_default_ray_config()
+
+
+@pytest.fixture(scope="session")
+def default_read_kwargs(default_ray_config):
+    """Read kwargs for the default config; copy before mutating."""
+    return default_ray_config.get_read_kwargs()
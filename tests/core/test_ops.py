@@ -1,38 +1,48 @@
 """Tests for the LLMData ops module."""
 
-from unittest.mock import Mock
-
 import pytest
 
 from llmdata.core.ops import FilterFn, MapFn, ReduceFn
 
 
-class TestMapFn:
-    """Test the MapFn abstract base class."""
+class _IdentityMapFn(MapFn):
+    def __call__(self, row):
+        return row
 
-    def test_mapfn_initialization(self):
-        """Test MapFn initialization with name and fields."""
 
-        class TestMapFn(MapFn):
-            def __call__(self, row):
-                return row
+class _TrueFilterFn(FilterFn):
+    def __call__(self, row):
+        return True
 
-        map_fn = TestMapFn("test_map", "field1", "field2")
 
-        assert map_fn.name == "test_map"
-        assert map_fn.on == ("field1", "field2")
+class _AddFieldMapFn(MapFn):
+    def __call__(self, row):
+        row["new_field"] = "added_value"
+        return row
+
 
-    def test_mapfn_initialization_no_fields(self):
-        """Test MapFn initialization with no fields."""
+class _LengthFilterFn(FilterFn):
+    def __call__(self, row):
+        text = row.get("text", "")
+        return len(text) > 10
 
-        class TestMapFn(MapFn):
-            def __call__(self, row):
-                return row
 
-        map_fn = TestMapFn("test_map")
+class TestMapFn:
+    """Test the MapFn abstract base class."""
+
+    @pytest.mark.parametrize(
+        "args, expected_on",
+        [
+            (("test_map", "field1", "field2"), ("field1", "field2")),
+            (("test_map",), ()),
+        ],
+    )
+    def test_mapfn_initialization(self, args, expected_on):
+        """Test MapFn initialization with and without fields."""
+        map_fn = _IdentityMapFn(*args)
 
         assert map_fn.name == "test_map"
-        assert map_fn.on == ()
+        assert map_fn.on == expected_on
 
     def test_mapfn_abstract_call(self):
         """Test that MapFn call is abstract."""
@@ -41,13 +51,7 @@ class TestMapFn:
 
     def test_mapfn_concrete_implementation(self):
         """Test concrete MapFn implementation."""
-
-        class AddFieldMapFn(MapFn):
-            def __call__(self, row):
-                row["new_field"] = "added_value"
-                return row
-
-        map_fn = AddFieldMapFn("add_field")
+        map_fn = _AddFieldMapFn("add_field")
         row = {"existing": "value"}
         result = map_fn(row)
 
@@ -58,44 +62,21 @@ class TestMapFn:
 class TestFilterFn:
     """Test the FilterFn abstract base class."""
 
-    def test_filterfn_initialization(self):
-        """Test FilterFn initialization with default parameters."""
-
-        class TestFilterFn(FilterFn):
-            def __call__(self, row):
-                return True
-
-        filter_fn = TestFilterFn("test_filter", "field1", "field2")
-
-        assert filter_fn.name == "test_filter"
-        assert filter_fn.on == ("field1", "field2")
-        assert filter_fn.if_missing is True
-
-    def test_filterfn_initialization_with_if_missing(self):
-        """Test FilterFn initialization with custom if_missing."""
-
-        class TestFilterFn(FilterFn):
-            def __call__(self, row):
-                return True
-
-        filter_fn = TestFilterFn("test_filter", "field1", if_missing=False)
-
-        assert filter_fn.name == "test_filter"
-        assert filter_fn.on == ("field1",)
-        assert filter_fn.if_missing is False
-
-    def test_filterfn_initialization_no_fields(self):
-        """Test FilterFn initialization with no fields."""
-
-        class TestFilterFn(FilterFn):
-            def __call__(self, row):
-                return True
-
-        filter_fn = TestFilterFn("test_filter")
+    @pytest.mark.parametrize(
+        "args, kwargs, expected_on, expected_if_missing",
+        [
+            (("test_filter", "field1", "field2"), {}, ("field1", "field2"), True),
+            (("test_filter", "field1"), {"if_missing": False}, ("field1",), False),
+            (("test_filter",), {}, [], True),
+        ],
+    )
+    def test_filterfn_initialization(self, args, kwargs, expected_on, expected_if_missing):
+        """Test FilterFn initialization across field and if_missing combinations."""
+        filter_fn = _TrueFilterFn(*args, **kwargs)
 
         assert filter_fn.name == "test_filter"
-        assert filter_fn.on == []
-        assert filter_fn.if_missing is True
+        assert filter_fn.on == expected_on
+        assert filter_fn.if_missing is expected_if_missing
 
     def test_filterfn_abstract_call(self):
         """Test that FilterFn call is abstract."""
@@ -104,13 +85,7 @@ class TestFilterFn:
 
     def test_filterfn_concrete_implementation(self):
         """Test concrete FilterFn implementation."""
-
-        class LengthFilterFn(FilterFn):
-            def __call__(self, row):
-                text = row.get("text", "")
-                return len(text) > 10
-
-        filter_fn = LengthFilterFn("length_filter", "text")
+        filter_fn = _LengthFilterFn("length_filter", "text")
 
         assert filter_fn({"text": "short"}) is False
         assert filter_fn({"text": "this is a long enough text"}) is True
@@ -132,18 +107,44 @@ class TestReduceFn:
         assert issubclass(ReduceFn, AggregateFnV2)
 
 
+class _FieldAccessMap(MapFn):
+    def __call__(self, row):
+        result = row.copy()
+        # Access fields specified in self.on
+        for field in self.on:
+            if field in row:
+                result[f"{field}_processed"] = f"processed_{row[field]}"
+        return result
+
+
+class _FieldAccessFilter(FilterFn):
+    def __call__(self, row):
+        # Check fields specified in self.on
+        for field in self.on:
+            if field not in row:
+                return self.if_missing
+            if not row[field]:
+                return False
+        return True
+
+
+@pytest.fixture(scope="module")
+def field_access_map():
+    return _FieldAccessMap("field_map", "text", "title")
+
+
+@pytest.fixture(scope="module")
+def field_access_filter():
+    return _FieldAccessFilter("field_filter", "text", "title", if_missing=False)
+
+
 class TestFunctionSignatures:
     """Test function signatures and parameter handling."""
 
     def test_mapfn_signature_validation(self):
         """Test MapFn signature requirements."""
-
-        class ValidMapFn(MapFn):
-            def __call__(self, row):
-                return row
-
         # Should be able to instantiate
-        map_fn = ValidMapFn("test")
+        map_fn = _IdentityMapFn("test")
         assert callable(map_fn)
 
         # Test call with proper signature
@@ -152,53 +153,25 @@ class TestFunctionSignatures:
 
     def test_filterfn_signature_validation(self):
         """Test FilterFn signature requirements."""
-
-        class ValidFilterFn(FilterFn):
-            def __call__(self, row):
-                return True
-
         # Should be able to instantiate
-        filter_fn = ValidFilterFn("test")
+        filter_fn = _TrueFilterFn("test")
         assert callable(filter_fn)
 
         # Test call with proper signature
         result = filter_fn({"key": "value"})
         assert isinstance(result, bool)
 
-    def test_field_access_patterns(self):
+    def test_field_access_patterns(self, field_access_map, field_access_filter):
         """Test common field access patterns in functions."""
-
-        class FieldAccessMap(MapFn):
-            def __call__(self, row):
-                result = row.copy()
-                # Access fields specified in self.on
-                for field in self.on:
-                    if field in row:
-                        result[f"{field}_processed"] = f"processed_{row[field]}"
-                return result
-
-        class FieldAccessFilter(FilterFn):
-            def __call__(self, row):
-                # Check fields specified in self.on
-                for field in self.on:
-                    if field not in row:
-                        return self.if_missing
-                    if not row[field]:
-                        return False
-                return True
-
         # Test map with field access
-        map_fn = FieldAccessMap("field_map", "text", "title")
         row = {"text": "content", "title": "heading", "other": "data"}
-        result = map_fn(row)
+        result = field_access_map(row)
 
         assert result["text_processed"] == "processed_content"
         assert result["title_processed"] == "processed_heading"
         assert "other_processed" not in result
 
         # Test filter with field access
-        filter_fn = FieldAccessFilter("field_filter", "text", "title", if_missing=False)
-
-        assert filter_fn({"text": "content", "title": "heading"}) is True
-        assert filter_fn({"text": "content"}) is False  # missing title
-        assert filter_fn({"text": "", "title": "heading"}) is False  # empty text
+        assert field_access_filter({"text": "content", "title": "heading"}) is True
+        assert field_access_filter({"text": "content"}) is False  # missing title
+        assert field_access_filter({"text": "", "title": "heading"}) is False  # empty text
@@ -1,13 +1,14 @@
 import pytest
 
+DataPipeline = pytest.importorskip("llmdata.core.pipeline").DataPipeline
+PipelineConfig = pytest.importorskip("llmdata.core.config").PipelineConfig
+
 
 class TestPipelineFunctionality:
     """Test basic pipeline functionality."""
 
     def test_pipeline_creation(self):
         """Test DataPipeline creation."""
-        from llmdata.core.pipeline import DataPipeline
-
         try:
             pipeline = DataPipeline()
             assert pipeline is not None
@@ -17,13 +18,6 @@ class TestPipelineFunctionality:
 
     def test_pipeline_with_config(self):
         """Test DataPipeline creation with configuration."""
-        try:
-            from llmdata.core.config import PipelineConfig
-            from llmdata.core.pipeline import DataPipeline
-
-            config = PipelineConfig(name="test", description="test pipeline")
-            pipeline = DataPipeline(config)
-            assert pipeline is not None
-
-        except (ImportError, TypeError):
-            pytest.skip("DataPipeline with pipeline_config test requires specific implementation")
+        config = PipelineConfig(name="test", description="test pipeline")
+        pipeline = DataPipeline(config)
+        assert pipeline is not None
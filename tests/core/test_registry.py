@@ -5,138 +5,131 @@ import pytest
 from llmdata.core.registry import Registry
 
 
+@pytest.fixture
+def registry():
+    """A fresh, empty Registry for each test."""
+    return Registry()
+
+
+# Plain classes registered by the tests below; defined once at module scope so
+# the per-test work is the registry call itself, not class creation.
+class _Component1:
+    pass
+
+
+class _Component2:
+    pass
+
+
+@pytest.fixture(scope="session")
+def global_reader_formats():
+    """Frozen snapshot of the reader formats registered in the global registry."""
+    from llmdata.core.registry import components
+
+    return frozenset(components.components("reader"))
+
+
+@pytest.fixture(scope="session")
+def global_writer_formats():
+    """Frozen snapshot of the writer formats registered in the global registry."""
+    from llmdata.core.registry import components
+
+    return frozenset(components.components("writer"))
+
+
 class TestRegistry:
     """Test the Registry class functionality."""
 
-    def setup_method(self):
-        """Set up a fresh components for each test."""
-        self.registry = Registry()
-
-    def test_registry_initialization(self):
+    def test_registry_initialization(self, registry):
         """Test components initializes empty."""
-        assert self.registry.categories() == []
+        assert registry.categories() == []
 
-    def test_add_component_decorator(self):
+    def test_add_component_decorator(self, registry):
         """Test adding components via decorator."""
+        registry.add("reader", "test_format")(_Component1)
 
-        @self.registry.add("reader", "test_format")
-        class TestReader:
-            pass
-
-        assert "reader" in self.registry.categories()
-        assert "test_format" in self.registry.components("reader")
-        assert self.registry.get("reader", "test_format") == TestReader
+        assert "reader" in registry.categories()
+        assert "test_format" in registry.components("reader")
+        assert registry.get("reader", "test_format") == _Component1
 
-    def test_add_multiple_components(self):
+    def test_add_multiple_components(self, registry):
         """Test adding multiple components to same category."""
+        registry.add("reader", "format1")(_Component1)
+        registry.add("reader", "format2")(_Component2)
 
-        @self.registry.add("reader", "format1")
-        class Reader1:
-            pass
-
-        @self.registry.add("reader", "format2")
-        class Reader2:
-            pass
-
-        components = self.registry.components("reader")
+        components = registry.components("reader")
         assert "format1" in components
         assert "format2" in components
         assert len(components) == 2
 
-    def test_add_components_different_categories(self):
+    def test_add_components_different_categories(self, registry):
         """Test adding components to different categories."""
+        registry.add("reader", "parquet")(_Component1)
+        registry.add("writer", "parquet")(_Component2)
 
-        @self.registry.add("reader", "parquet")
-        class ParquetReader:
-            pass
-
-        @self.registry.add("writer", "parquet")
-        class ParquetWriter:
-            pass
-
-        categories = self.registry.categories()
+        categories = registry.categories()
         assert "reader" in categories
         assert "writer" in categories
         assert len(categories) == 2
 
-    def test_get_component(self):
+    def test_get_component(self, registry):
         """Test retrieving registered components."""
+        registry.add("filter", "language")(_Component1)
 
-        @self.registry.add("filter", "language")
-        class LanguageFilter:
-            pass
-
-        retrieved = self.registry.get("filter", "language")
-        assert retrieved == LanguageFilter
+        retrieved = registry.get("filter", "language")
+        assert retrieved == _Component1
 
-    def test_get_nonexistent_category(self):
+    def test_get_nonexistent_category(self, registry):
         """Test error when getting from nonexistent category."""
         with pytest.raises(ValueError, match="Unknown category 'nonexistent'"):
-            self.registry.get("nonexistent", "format")
+            registry.get("nonexistent", "format")
 
-    def test_get_nonexistent_component(self):
+    def test_get_nonexistent_component(self, registry):
         """Test error when getting nonexistent component."""
-
-        @self.registry.add("reader", "parquet")
-        class ParquetReader:
-            pass
+        registry.add("reader", "parquet")(_Component1)
 
         with pytest.raises(ValueError, match="Unknown type 'nonexistent' in category 'reader'"):
-            self.registry.get("reader", "nonexistent")
+            registry.get("reader", "nonexistent")
 
-    def test_has_component(self):
+    def test_has_component(self, registry):
         """Test checking if component exists."""
+        registry.add("writer", "csv")(_Component1)
 
-        @self.registry.add("writer", "csv")
-        class CSVWriter:
-            pass
+        assert registry.has("writer", "csv") is True
+        assert registry.has("writer", "parquet") is False
+        assert registry.has("reader", "csv") is False
 
-        assert self.registry.has("writer", "csv") is True
-        assert self.registry.has("writer", "parquet") is False
-        assert self.registry.has("reader", "csv") is False
-
-    def test_components_for_category(self):
+    def test_components_for_category(self, registry):
         """Test listing components for specific category."""
+        registry.add("tagger", "language")(_Component1)
+        registry.add("tagger", "sentiment")(_Component2)
 
-        @self.registry.add("tagger", "language")
-        class LanguageTagger:
-            pass
-
-        @self.registry.add("tagger", "sentiment")
-        class SentimentTagger:
-            pass
-
-        components = self.registry.components("tagger")
+        components = registry.components("tagger")
         assert "language" in components
         assert "sentiment" in components
         assert len(components) == 2
 
-    def test_components_nonexistent_category(self):
+    def test_components_nonexistent_category(self, registry):
         """Test error when listing components for nonexistent category."""
         with pytest.raises(ValueError, match="Unknown category 'nonexistent'"):
-            self.registry.components("nonexistent")
+            registry.components("nonexistent")
 
-    def test_decorator_returns_class(self):
+    def test_decorator_returns_class(self, registry):
         """Test that decorator returns the original class."""
         original_class = type("TestClass", (), {})
-        decorated_class = self.registry.add("test", "format")(original_class)
+        decorated_class = registry.add("test", "format")(original_class)
         assert decorated_class is original_class
 
-    def test_overwrite_existing_component(self):
+    def test_overwrite_existing_component(self, registry):
         """Test overwriting existing component registration."""
-
-        @self.registry.add("reader", "json")
-        class JSONReader1:
-            pass
-
-        @self.registry.add("reader", "json")
-        class JSONReader2:
-            pass
+        registry.add("reader", "json")(_Component1)
+        registry.add("reader", "json")(_Component2)
 
         # Should return the latest registered class
-        assert self.registry.get("reader", "json") == JSONReader2
+        assert registry.get("reader", "json") is _Component2
 
 
+@pytest.mark.xdist_group(name="global_registry")
 class TestGlobalRegistry:
     """Test the global components instance."""
 
@@ -160,52 +153,40 @@ class TestGlobalRegistry:
         assert registry2.get("test", "shared") == SharedClass
 
 
+@pytest.mark.xdist_group(name="global_registry")
 class TestRegistryIntegration:
     """Test components integration with actual components."""
 
-    def test_reader_registration(self):
+    def test_reader_registration(self, global_reader_formats):
         """Test that readers are properly registered."""
-        from llmdata.core.registry import components
-
-        # Check that readers are registered
-        assert components.has("reader", "parquet")
-        assert components.has("reader", "jsonl")
-        assert components.has("reader", "csv")
-        assert components.has("reader", "text")
+        assert "parquet" in global_reader_formats
+        assert "jsonl" in global_reader_formats
+        assert "csv" in global_reader_formats
+        assert "text" in global_reader_formats
 
-    def test_writer_registration(self):
+    def test_writer_registration(self, global_writer_formats):
         """Test that writers are properly registered."""
-        from llmdata.core.registry import components
-
-        # Check that writers are registered
-        assert components.has("writer", "parquet")
-        assert components.has("writer", "jsonl")
-        assert components.has("writer", "csv")
+        assert "parquet" in global_writer_formats
+        assert "jsonl" in global_writer_formats
+        assert "csv" in global_writer_formats
 
-    def test_component_instantiation(self):
+    def test_component_instantiation(self, default_ray_config):
         """Test that registered components can be instantiated."""
-        from llmdata.core.config import get_default_ray_config
         from llmdata.core.registry import components
 
         # Get a reader class and instantiate it
         reader_cls = components.get("reader", "parquet")
-        config = get_default_ray_config()
-        reader = reader_cls(config)
+        reader = reader_cls(default_ray_config)
 
         assert reader is not None
         assert callable(reader)
 
-    def test_components_list_formats(self):
+    def test_components_list_formats(self, global_reader_formats, global_writer_formats):
         """Test listing available formats for components."""
-        from llmdata.core.registry import components
-
-        reader_formats = components.components("reader")
-        writer_formats = components.components("writer")
-
         # Should have multiple formats
-        assert len(reader_formats) >= 3
-        assert len(writer_formats) >= 3
+        assert len(global_reader_formats) >= 3
+        assert len(global_writer_formats) >= 3
 
         # Common formats should exist
-        assert "parquet" in reader_formats
-        assert "parquet" in writer_formats
+        assert "parquet" in global_reader_formats
+        assert "parquet" in global_writer_formats
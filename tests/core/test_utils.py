@@ -2,7 +2,7 @@ from typing import Any, Dict
 
 import pytest
 
-from llmdata.core.utils import get_field, set_field
+from llmdata.core.utils import compile_getter, get_field, get_many, set_field
 
 
 class TestAddField:
@@ -178,6 +178,68 @@ class TestGetField:
         assert get_field(row, "any.field") is None
 
 
+class TestGetMany:
+    """Test cases for get_many function."""
+
+    def test_get_many_shared_prefix(self):
+        """Test getting several fields under the same prefix."""
+        row = {"metadata": {"language": {"score": 0.95, "name": "en"}, "processing": {"timestamp": "2025-06-19"}}}
+        result = get_many(
+            row, ["metadata.language.score", "metadata.language.name", "metadata.processing.timestamp"]
+        )
+
+        assert result == {
+            "metadata.language.score": 0.95,
+            "metadata.language.name": "en",
+            "metadata.processing.timestamp": "2025-06-19",
+        }
+
+    def test_get_many_simple_fields(self):
+        """Test getting flat fields."""
+        row = {"key": "value", "number": 42}
+        assert get_many(row, ["key", "number"]) == {"key": "value", "number": 42}
+
+    def test_get_many_missing_fields(self):
+        """Test that missing or broken paths resolve to None."""
+        row = {"metadata": {"language": {"score": 0.95}}, "flat": 1}
+        result = get_many(row, ["metadata.language.missing", "metadata.nonexistent.field", "flat.nested", ""])
+
+        assert result == {
+            "metadata.language.missing": None,
+            "metadata.nonexistent.field": None,
+            "flat.nested": None,
+            "": None,
+        }
+
+    def test_get_many_matches_get_field(self):
+        """Test that get_many agrees with get_field on every path."""
+        row = {"a": {"b": {"c": "value", "d": None}}, "top": True}
+        fields = ["a.b.c", "a.b.d", "a.b", "a.b.c.e", "top", "missing"]
+
+        assert get_many(row, fields) == {field: get_field(row, field) for field in fields}
+
+
+class TestCompileGetter:
+    """Test cases for compile_getter function."""
+
+    def test_compiled_getter_nested(self):
+        """Test a compiled accessor on a nested path."""
+        getter = compile_getter("metadata.language.score")
+        assert getter({"metadata": {"language": {"score": 0.95}}}) == 0.95
+
+    def test_compiled_getter_missing(self):
+        """Test that missing or broken paths return None."""
+        getter = compile_getter("metadata.language.score")
+        assert getter({}) is None
+        assert getter({"metadata": {"language": "en"}}) is None
+
+    def test_compiled_getter_matches_get_field(self):
+        """Test that compiled accessors agree with get_field."""
+        row = {"a": {"b": {"c": "value"}}, "flat": 42, "broken": [1, 2]}
+        for field in ["a.b.c", "a.b", "a.missing.c", "flat", "broken.length", ""]:
+            assert compile_getter(field)(row) == get_field(row, field)
+
+
 class TestIntegration:
     """Integration tests for add_field and get_field working together."""
 
@@ -51,9 +51,14 @@ class TestWriterBaseClass:
 class TestParquetWriter:
     """Test the ParquetWriter class."""
 
+    @classmethod
+    def setup_class(cls):
+        """Build the shared config and its write kwargs once per class."""
+        cls.config = get_default_ray_config()
+        cls.base_kwargs = cls.config.get_write_kwargs()
+
     def setup_method(self):
-        """Set up test fixtures."""
-        self.config = get_default_ray_config()
+        """Set up per-test fixtures."""
         self.writer = ParquetWriter(self.config)
         self.mock_dataset = Mock()
 
@@ -61,8 +66,7 @@ class TestParquetWriter:
         """Test basic ParquetWriter call."""
         self.writer(self.mock_dataset, "test.parquet")
 
-        expected_kwargs = self.config.get_write_kwargs()
-        expected_kwargs["compression"] = "snappy"  # Default compression
+        expected_kwargs = self.base_kwargs | {"compression": "snappy"}  # Default compression
 
         self.mock_dataset.write_parquet.assert_called_once_with("test.parquet", filesystem=None, **expected_kwargs)
 
@@ -71,8 +75,7 @@ class TestParquetWriter:
         writer = ParquetWriter(self.config, compression="gzip")
         writer(self.mock_dataset, "test.parquet")
 
-        expected_kwargs = self.config.get_write_kwargs()
-        expected_kwargs["compression"] = "gzip"
+        expected_kwargs = self.base_kwargs | {"compression": "gzip"}
 
         self.mock_dataset.write_parquet.assert_called_once_with("test.parquet", filesystem=None, **expected_kwargs)
 
@@ -86,8 +89,7 @@ class TestParquetWriter:
         writer = ParquetWriter(self.config, **params)
         writer(self.mock_dataset, "test.parquet")
 
-        expected_kwargs = self.config.get_write_kwargs()
-        expected_kwargs.update(params)
+        expected_kwargs = self.base_kwargs | params
 
         self.mock_dataset.write_parquet.assert_called_once_with("test.parquet", filesystem=None, **expected_kwargs)
 
@@ -97,8 +99,7 @@ class TestParquetWriter:
         writer = ParquetWriter(self.config, mock_filesystem)
         writer(self.mock_dataset, "s3://bucket/test.parquet")
 
-        expected_kwargs = self.config.get_write_kwargs()
-        expected_kwargs["compression"] = "snappy"
+        expected_kwargs = self.base_kwargs | {"compression": "snappy"}
 
         self.mock_dataset.write_parquet.assert_called_once_with(
             "s3://bucket/test.parquet", filesystem=mock_filesystem, **expected_kwargs
@@ -108,9 +109,14 @@ class TestParquetWriter:
 class TestJSONLWriter:
     """Test the JSONLWriter class."""
 
+    @classmethod
+    def setup_class(cls):
+        """Build the shared config and its write kwargs once per class."""
+        cls.config = get_default_ray_config()
+        cls.base_kwargs = cls.config.get_write_kwargs()
+
     def setup_method(self):
-        """Set up test fixtures."""
-        self.config = get_default_ray_config()
+        """Set up per-test fixtures."""
         self.writer = JSONLWriter(self.config)
         self.mock_dataset = Mock()
 
@@ -118,7 +124,7 @@ class TestJSONLWriter:
         """Test basic JSONLWriter call."""
         self.writer(self.mock_dataset, "test.jsonl")
 
-        expected_kwargs = self.config.get_write_kwargs()
+        expected_kwargs = self.base_kwargs
 
         self.mock_dataset.write_json.assert_called_once_with("test.jsonl", filesystem=None, **expected_kwargs)
 
@@ -128,8 +134,7 @@ class TestJSONLWriter:
         writer = JSONLWriter(self.config, **params)
         writer(self.mock_dataset, "test.jsonl")
 
-        expected_kwargs = self.config.get_write_kwargs()
-        expected_kwargs.update(params)
+        expected_kwargs = self.base_kwargs | params
 
         self.mock_dataset.write_json.assert_called_once_with("test.jsonl", filesystem=None, **expected_kwargs)
 
@@ -137,9 +142,14 @@ class TestJSONLWriter:
 class TestCSVWriter:
     """Test the CSVWriter class."""
 
+    @classmethod
+    def setup_class(cls):
+        """Build the shared config and its write kwargs once per class."""
+        cls.config = get_default_ray_config()
+        cls.base_kwargs = cls.config.get_write_kwargs()
+
     def setup_method(self):
-        """Set up test fixtures."""
-        self.config = get_default_ray_config()
+        """Set up per-test fixtures."""
         self.writer = CSVWriter(self.config)
         self.mock_dataset = Mock()
 
@@ -147,8 +157,7 @@ class TestCSVWriter:
         """Test basic CSVWriter call."""
         self.writer(self.mock_dataset, "test.csv")
 
-        expected_kwargs = self.config.get_write_kwargs()
-        expected_kwargs["include_header"] = True  # Default header
+        expected_kwargs = self.base_kwargs | {"include_header": True}  # Default header
 
         self.mock_dataset.write_csv.assert_called_once_with("test.csv", filesystem=None, **expected_kwargs)
 
@@ -164,8 +173,7 @@ class TestCSVWriter:
         writer = CSVWriter(self.config, **params)
         writer(self.mock_dataset, "test.csv")
 
-        expected_kwargs = self.config.get_write_kwargs()
-        expected_kwargs.update(params)
+        expected_kwargs = self.base_kwargs | params
 
         self.mock_dataset.write_csv.assert_called_once_with("test.csv", filesystem=None, **expected_kwargs)
 
@@ -174,8 +182,7 @@ class TestCSVWriter:
         writer = CSVWriter(self.config, include_header=False)
         writer(self.mock_dataset, "test.csv")
 
-        expected_kwargs = self.config.get_write_kwargs()
-        expected_kwargs["include_header"] = False
+        expected_kwargs = self.base_kwargs | {"include_header": False}
 
         self.mock_dataset.write_csv.assert_called_once_with("test.csv", filesystem=None, **expected_kwargs)
 
@@ -272,3 +272,25 @@ class TestDeduplicationFormatter(unittest.TestCase):
         # Verify deduplication worked
         self.assertLess(len(deduplicated_ids), len(original_ids))
         self.assertEqual(deduplicated_ids, {0, 1, 5})
+
+
+class TestSpacyModelShipping(unittest.TestCase):
+    """Test the (config, bytes) payload used to ship spaCy pipelines to actors."""
+
+    def test_rebuilt_pipeline_keeps_components(self):
+        """Test that a pipeline rebuilt from a payload retains its components."""
+        try:
+            import spacy
+
+            from llmdata.processors.format.pii import _deserialize_spacy_model, _serialize_spacy_model
+        except ImportError:
+            self.skipTest("spacy/presidio not installed")
+
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        rebuilt = _deserialize_spacy_model(_serialize_spacy_model(nlp))
+
+        # A blank().from_bytes() round trip would silently drop every
+        # component; the rebuilt pipeline must still have them and work
+        self.assertEqual(rebuilt.pipe_names, nlp.pipe_names)
+        self.assertEqual(len(list(rebuilt("First sentence. Second sentence.").sents)), 2)